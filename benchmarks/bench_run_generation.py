@@ -0,0 +1,214 @@
+"""Benchmark each phase of run_generation on synthetic populations.
+
+    python benchmarks/bench_run_generation.py                      # 1k .. 1M individuals
+    python benchmarks/bench_run_generation.py --sizes 1000 10000 --save-baseline
+    python benchmarks/bench_run_generation.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_run_generation.py --layout compact --sizes 1000000
+
+Each size runs one generation's phases in order on a fresh population drawn
+from the prototypes, timing every phase (best of --repeats) and measuring its
+peak traced allocation in a separate tracemalloc pass. Results are written as
+JSON; with --baseline, phases slower than the baseline by more than
+--tolerance are reported and the exit status is 1.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokemon_evolution import core
+from pokemon_evolution.core import (
+    new_individuals, make_rngs, apply_params, memory_report, move_phase,
+    forage_plants, run_combat, rest_phase, mating_phase, upkeep_phase,
+    reproduction_phase, cull_to_capacity, aggregate_species,
+)
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+PHASES = [
+    ("movement", lambda pop, gen, rng: move_phase(pop, rng)),
+    ("forage", lambda pop, gen, rng: forage_plants(pop)),
+    ("combat", lambda pop, gen, rng: run_combat(pop, rng)),
+    ("rest", lambda pop, gen, rng: rest_phase(pop)),
+    ("mating", lambda pop, gen, rng: mating_phase(pop)),
+    ("upkeep", lambda pop, gen, rng: upkeep_phase(pop)),
+    ("reproduction", reproduction_phase),
+    ("carrying_capacity", lambda pop, gen, rng: cull_to_capacity(pop, rng)),
+    ("aggregation", lambda pop, gen, rng: aggregate_species(pop)),
+]
+NONLINEAR_EXPONENT = 1.15  # local log-log slope above which a phase counts as superlinear
+NOISE_FLOOR = 0.5e-3       # slowdowns smaller than this (seconds) are timer noise, never regressions
+
+def scaled_params(n):
+    """Carrying capacity and plant supply scaled so per-capita dynamics match the defaults"""
+    scale = n / core.DEFAULT_PARAMS["K_TOTAL"]
+    return {"K_TOTAL": n, "P_TOTAL": core.DEFAULT_PARAMS["P_TOTAL"] * scale}
+
+def synthetic_population(n, seed):
+    """n individuals of uniformly drawn species with spread-out levels, resources and energy.
+
+    Returns the population and the Generator the phases then draw from.
+    """
+    rng = make_rngs(seed, 'shared')['setup']
+    sids = rng.choice(core.prototypes['species_id'].to_numpy(), n)
+    pop = core.population_class()(capacity=2 * n)
+    pop.append(new_individuals(sids))
+    pop.level = np.minimum(rng.integers(1, 30, n), pop.max_level)
+    pop.refresh_stats(np.arange(n))
+    pop.resource = rng.uniform(core.R0 / 2, core.RESOURCE_MAX, n)
+    pop.rest_energy = rng.uniform(20.0, 100.0, n)
+    pop.mating_readiness = rng.uniform(0.0, 100.0, n)
+    if core.GRID_SIZE:
+        pop.cell = rng.integers(core.GRID_SIZE ** 2, size=n)
+    return pop, rng
+
+def bench_size(n, repeats, seed):
+    """Per-phase timings and peak allocations for one population size"""
+    seconds = {name: [] for name, _ in PHASES}
+    for _ in range(repeats):
+        pop, rng = synthetic_population(n, seed)
+        for name, phase in PHASES:
+            start = time.perf_counter()
+            phase(pop, 0, rng)
+            seconds[name].append(time.perf_counter() - start)
+    peaks = {}
+    pop, rng = synthetic_population(n, seed)
+    tracemalloc.start()
+    for name, phase in PHASES:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        phase(pop, 0, rng)
+        peaks[name] = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    rows = [{"size": n, "phase": name, "seconds": min(seconds[name]),
+             "ns_per_individual": min(seconds[name]) / n * 1e9, "peak_bytes": peaks[name]}
+            for name, _ in PHASES]
+    total = sum(row["seconds"] for row in rows)
+    rows.append({"size": n, "phase": "total", "seconds": total, "ns_per_individual": total / n * 1e9,
+                 "peak_bytes": max(peaks.values())})
+    return rows
+
+def scaling_exponents(rows):
+    """Local log-log slope of time vs size between consecutive sizes, per phase"""
+    by_phase = {}
+    for row in rows:
+        by_phase.setdefault(row["phase"], []).append((row["size"], row["seconds"]))
+    exponents = {}
+    for phase, points in by_phase.items():
+        points.sort()
+        exponents[phase] = [
+            {"from": n1, "to": n2, "exponent": float(np.log(t2 / t1) / np.log(n2 / n1))}
+            for (n1, t1), (n2, t2) in zip(points, points[1:]) if t1 > 0 and t2 > 0
+        ]
+    return exponents
+
+def compare(rows, baseline, tolerance):
+    """Rows whose time exceeds the baseline's by more than tolerance (a fraction)"""
+    reference = {(row["size"], row["phase"]): row["seconds"] for row in baseline["results"]}
+    regressions = []
+    for row in rows:
+        base = reference.get((row["size"], row["phase"]))
+        if base and row["seconds"] > max(base * (1 + tolerance), base + NOISE_FLOOR):
+            regressions.append(dict(row, baseline_seconds=base, ratio=row["seconds"] / base))
+    return regressions
+
+def plot_scaling(rows, path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots(figsize=(9, 6))
+    for name in [name for name, _ in PHASES] + ["total"]:
+        points = sorted((row["size"], row["ns_per_individual"]) for row in rows if row["phase"] == name)
+        ax.plot(*zip(*points), marker='o', label=name, linewidth=2 if name == "total" else 1)
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel("Population size")
+    ax.set_ylabel("ns per individual")
+    ax.set_title("run_generation phase cost (flat = linear scaling)")
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+
+def parse_args(argv=None):
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--combat-mode", choices=sorted(core.COMBAT_ENGINES), default=core.COMBAT_MODE)
+    parser.add_argument("--grid-size", type=int, default=core.GRID_SIZE,
+                        help="habitat grid side (0 = well mixed)")
+    parser.add_argument("--layout", choices=sorted(core.POPULATION_LAYOUTS), default=core.POPULATION_LAYOUT,
+                        help="population column layout")
+    parser.add_argument("--seed", type=int, default=core.SEED)
+    parser.add_argument("--out", default=os.path.join(here, "results.json"))
+    parser.add_argument("--baseline", help="compare against a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown vs the baseline before a phase is flagged")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="also write the results to benchmarks/baseline.json")
+    parser.add_argument("--plot", metavar="PNG", help="save scaling curves to this file")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows = []
+    for n in args.sizes:
+        previous = apply_params(dict(scaled_params(n), COMBAT_MODE=args.combat_mode, GRID_SIZE=args.grid_size,
+                                     POPULATION_LAYOUT=args.layout))
+        try:
+            size_rows = bench_size(n, args.repeats, args.seed)
+        finally:
+            apply_params(previous)
+        rows.extend(size_rows)
+        print(f"\n{n:>9,d} individuals")
+        for row in size_rows:
+            print(f"  {row['phase']:18s} {row['seconds'] * 1e3:10.2f} ms {row['ns_per_individual']:10.0f} ns/ind"
+                  f" {row['peak_bytes'] / 2**20:9.1f} MiB peak")
+    store = core.POPULATION_LAYOUTS[args.layout](capacity=0)
+    bytes_per_individual = int(memory_report(store)['bytes_per_individual'].iloc[-1])
+    print(f"\n{args.layout} layout: {bytes_per_individual} bytes per individual")
+    exponents = scaling_exponents(rows)
+    print("\nScaling exponents (1.0 = linear):")
+    for phase, steps in exponents.items():
+        marks = " ".join(f"{s['exponent']:.2f}{'*' if s['exponent'] > NONLINEAR_EXPONENT else ''}" for s in steps)
+        print(f"  {phase:18s} {marks}")
+    results = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__,
+                 "machine": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                 "repeats": args.repeats, "seed": args.seed, "combat_mode": args.combat_mode,
+                 "grid_size": args.grid_size, "layout": args.layout,
+                 "bytes_per_individual": bytes_per_individual,
+                 "peak_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024},
+        "results": rows,
+        "scaling": exponents,
+    }
+    paths = [args.out]
+    if args.save_baseline:
+        paths.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json"))
+    for path in paths:
+        with open(path, "w") as f:
+            json.dump(results, f, indent=1)
+    print(f"\nResults written to {', '.join(paths)}")
+    if args.plot:
+        plot_scaling(rows, args.plot)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(rows, json.load(f), args.tolerance)
+        for row in regressions:
+            print(f"REGRESSION {row['phase']} @ {row['size']:,d}: {row['seconds'] * 1e3:.2f} ms vs "
+                  f"{row['baseline_seconds'] * 1e3:.2f} ms ({row['ratio']:.2f}x)")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,14 @@
+"""Pokémon ecosystem evolution simulator"""
+from .core import (
+    SEED, SIM_PARAMS, DEFAULT_PARAMS, apply_params,
+    Population, CompactPopulation, Graveyard, Genealogy, memory_report, SpeciesTable, load_species_table,
+    initial_population, run_generation, interaction_phases, close_generation, run_simulation, make_rngs,
+    forage_plants, combat_phase, rest_phase, mating_phase, upkeep_phase, reproduction_phase,
+    cull_to_capacity, aggregate_species,
+)
+from .telemetry import TelemetryWriter, read_telemetry, telemetry_results
+from .profiling import PhaseProfiler, read_metrics
+from .checkpoint import save_checkpoint, load_checkpoint
+from .genealogy import ancestors, descendants, lineage_survival, cross_species_births
+from .experiments import run_replicates, run_sweep, grid_design, latin_hypercube
+from .parallel import run_sharded
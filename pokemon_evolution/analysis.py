@@ -0,0 +1,41 @@
+"""Post-run analytics as matrix reductions over the species series.
+
+A run's species_count_series / species_time_series are (generation,
+species_id) matrices: column sid describes species sid, like the arrays
+of aggregate_species (column 0 and any unused ids stay zero).
+"""
+import numpy as np
+
+from . import core
+
+def group_totals(series, labels, n_groups):
+    """(generation, group) sums of a species series given each species id's group (-1 = none)"""
+    labels = np.asarray(labels)
+    onehot = np.zeros((len(labels), n_groups))
+    member = np.flatnonzero(labels >= 0)
+    onehot[member, labels[member]] = 1.0
+    return series[:, :len(labels)] @ onehot
+
+def diet_totals(series):
+    """(generation, diet) totals in DIETS order"""
+    table = core.species_table
+    return group_totals(series, np.where(table.valid, table.diet, -1), len(core.DIETS))
+
+def egg_group_totals(series):
+    """(generation, egg group) totals by primary egg group, with the group names"""
+    table = core.species_table
+    labels = np.where(table.valid, table.egg_groups[:, 0], -1)
+    return group_totals(series, labels, len(table.egg_group_names)), table.egg_group_names
+
+def extinction_generations(counts):
+    """First generation each species' count is zero, -1 where it never is (or the id is unused)"""
+    zero = counts == 0
+    valid = np.zeros(counts.shape[1], dtype=bool)
+    valid[:core.N_SPECIES_IDS] = core.species_table.valid[:counts.shape[1]]
+    return np.where(zero.any(axis=0) & valid, zero.argmax(axis=0), -1)
+
+def top_species(series, n, generation=-1):
+    """Species ids with the n largest values in one generation (present species only)"""
+    row = series[generation]
+    ranked = np.argsort(-row, kind='stable')[:n]
+    return ranked[row[ranked] > 0]
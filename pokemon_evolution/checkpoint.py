@@ -0,0 +1,104 @@
+"""Binary snapshots of a run for pause, resume and branching"""
+import json
+import os
+import shutil
+
+import numpy as np
+
+from . import core
+from .core import Graveyard, Genealogy, SIM_PARAMS, SERIES_DTYPES, apply_params
+
+# Checkpoints
+def _rng_states(rngs):
+    """Bit-generator states of a run's Generators, plus which phase uses which"""
+    streams = list({id(gen): gen for gen in rngs.values()}.values())
+    index = {id(gen): i for i, gen in enumerate(streams)}
+    return [gen.bit_generator.state for gen in streams], {name: index[id(gen)] for name, gen in rngs.items()}
+
+def _restore_rngs(states, phases):
+    streams = []
+    for state in states:
+        bit_generator = getattr(np.random, state['bit_generator'])()
+        bit_generator.state = state
+        streams.append(np.random.Generator(bit_generator))
+    return {name: streams[i] for name, i in phases.items()}
+
+def save_checkpoint(path, state, generation):
+    """Snapshot a run (see run_simulation) before `generation` to directory path.
+
+    Population, graveyard and genealogy columns and the species series are
+    one .npy each, so snapshots load (or memory-map) quickly; everything small,
+    including the Generator states, goes to meta.json. A telemetry run's series
+    stay in its stream, whose directory and format are recorded instead. The snapshot is written
+    beside path and renamed into place, so a crash never leaves a half-written
+    checkpoint.
+    """
+    tmp = path + ".tmp"
+    if os.path.exists(tmp):
+        shutil.rmtree(tmp)
+    os.makedirs(tmp)
+    population = state['population']
+    population.save(os.path.join(tmp, "population"))
+    for name in ("graveyard", "genealogy"):
+        if state[name] is not None:
+            state[name].save(os.path.join(tmp, name))
+    for key in SERIES_DTYPES:
+        if state[key] is not None:
+            np.save(os.path.join(tmp, f"{key}.npy"), state[key][:generation])
+    rng_states, rng_phases = _rng_states(state['rngs'])
+    meta = {
+        "generation": generation,
+        "population_generation": population.generation,
+        "next_uid": population.next_uid,
+        "params": {name: getattr(core, name) for name in SIM_PARAMS},
+        "gen_logs": state['gen_logs'],
+        "extinction_events": [[int(sid), int(gen)] for sid, gen in state['extinction_events'].items()],
+        "stopped": state['stopped'],
+        "telemetry": state.get('telemetry'),
+        "rng_states": rng_states,
+        "rng_phases": rng_phases,
+    }
+    with open(os.path.join(tmp, "meta.json"), "w") as f:
+        json.dump(meta, f)
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.replace(tmp, path)
+
+def load_checkpoint(path, mmap_mode=None):
+    """Restore a snapshot: reinstates its parameters, returns the run state with its RNG streams
+
+    Pass the result to run_simulation(state=...) to continue the run exactly
+    where it stopped; call apply_params afterwards to branch with new values.
+    mmap_mode='c' maps the columns copy-on-write, which can still be resumed;
+    'r' maps them read-only, for inspection only.
+    A telemetry run continues with TelemetryWriter(dir, ..., start=state['generation'])
+    on state['telemetry']['dir'], or in memory with its series read back from the stream.
+    """
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    apply_params(meta['params'])
+    population = core.population_class().load(os.path.join(path, "population"), mmap_mode)
+    population.generation = meta['population_generation']
+    population.next_uid = meta['next_uid']
+    stores = {}
+    for name, cls in (("graveyard", Graveyard), ("genealogy", Genealogy)):
+        stores[name] = None
+        if os.path.isdir(os.path.join(path, name)):
+            stores[name] = cls.load(os.path.join(path, name), mmap_mode)
+    series = {}
+    for key in SERIES_DTYPES:
+        series_path = os.path.join(path, f"{key}.npy")
+        series[key] = np.load(series_path) if os.path.exists(series_path) else None
+    return {
+        "generation": meta['generation'],
+        "population": population,
+        "graveyard": stores['graveyard'],
+        "genealogy": stores['genealogy'],
+        "rngs": _restore_rngs(meta['rng_states'], meta['rng_phases']),
+        "gen_logs": meta['gen_logs'],
+        "species_time_series": series['species_time_series'],
+        "species_count_series": series['species_count_series'],
+        "extinction_events": {sid: gen for sid, gen in meta['extinction_events']},
+        "stopped": meta['stopped'],
+        "telemetry": meta.get('telemetry'),
+    }
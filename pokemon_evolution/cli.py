@@ -0,0 +1,132 @@
+"""Command-line entry point"""
+import argparse
+import json
+import os
+
+from . import core
+from .core import apply_params, run_simulation
+from .checkpoint import load_checkpoint
+from .plots import report
+from .profiling import PhaseProfiler
+from .experiments import load_design, run_replicates, run_sweep, save_replicates, summarize_run
+from .parallel import run_sharded
+from .telemetry import TelemetryWriter, telemetry_results
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pokémon ecosystem evolution simulator")
+    parser.add_argument("--generations", type=int, default=None)
+    parser.add_argument("--replicates", type=int, default=0,
+                        help="run N independent replicates in parallel instead of one plotted run")
+    parser.add_argument("--sweep", metavar="DESIGN.json",
+                        help="run a parameter sweep described by a JSON design file")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes for replicates and sweeps (default: all cores)")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="split one run across N worker processes (grid bands or islands)")
+    parser.add_argument("--migrate-every", type=int, default=1,
+                        help="generations between island migrations when sharding a well-mixed world")
+    parser.add_argument("--migration-rate", type=float, default=0.01,
+                        help="fraction of each island's capacity sent to the next island")
+    parser.add_argument("--out", default=None,
+                        help="output directory (default: replicates/, sweep/ or sharded/)")
+    parser.add_argument("--telemetry", metavar="DIR",
+                        help="stream per-generation species aggregates to DIR instead of memory")
+    parser.add_argument("--telemetry-format", choices=["npy", "csv", "arrow"], default="npy")
+    parser.add_argument("--checkpoint-dir", default="checkpoints")
+    parser.add_argument("--checkpoint-every", type=int, default=0,
+                        help="snapshot the full run state every N generations (0 = off)")
+    parser.add_argument("--resume", metavar="CHECKPOINT", help="continue a run from a checkpoint")
+    parser.add_argument("--set", metavar="NAME=VALUE", action="append", default=[],
+                        help="override a simulation parameter (applied after --resume)")
+    parser.add_argument("--metrics", metavar="PATH.jsonl",
+                        help="stream per-generation phase timings and event counts to this file")
+    parser.add_argument("--cprofile", metavar="START:STOP",
+                        help="run cProfile over generations START..STOP-1")
+    parser.add_argument("--cprofile-out", default="generations.prof")
+    parser.add_argument("--figures", metavar="DIR", default="figures",
+                        help="directory the report figures are saved to")
+    parser.add_argument("--show", action="store_true", help="also open the figures interactively")
+    parser.add_argument("--no-plots", action="store_true",
+                        help="print the summary only (skips matplotlib and scikit-learn)")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="print the bytes per individual of the final population's columns")
+    return parser.parse_args(argv)
+
+def parse_overrides(items):
+    """--set NAME=VALUE pairs as a parameter dict (values parsed as JSON where possible)"""
+    overrides = {}
+    for item in items:
+        name, value = item.split("=", 1)
+        try:
+            overrides[name] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[name] = value
+    return overrides
+
+def telemetry_sink(args, state, generations):
+    """TelemetryWriter for --telemetry; a resumed run appends to the stream its checkpoint recorded"""
+    if state is None:
+        return TelemetryWriter(args.telemetry, generations, args.telemetry_format)
+    streamed = state['telemetry']
+    if streamed is None:
+        raise SystemExit("this checkpoint keeps its series in memory; resume it without --telemetry")
+    if os.path.realpath(streamed['dir']) != os.path.realpath(args.telemetry):
+        raise SystemExit(f"this checkpoint streams telemetry to {streamed['dir']}; "
+                         f"resume it with --telemetry {streamed['dir']} or without --telemetry")
+    return TelemetryWriter(args.telemetry, generations, streamed['format'], start=state['generation'])
+
+def print_memory_report(pop):
+    table = core.memory_report(pop)
+    info = table.attrs
+    print(f"\n{type(pop).__name__} ({core.POPULATION_LAYOUT} layout)")
+    print(table.to_string(index=False))
+    if info['shared_bytes']:
+        print(f"plus {info['shared_bytes'] / 2**10:.1f} KiB of shared stat rows "
+              f"({len(pop.stat_pool) - pop.n_prototypes} private)")
+    print(f"{info['individuals']} individuals: {info['used_bytes'] / 2**20:.1f} MiB used, "
+          f"{info['allocated_bytes'] / 2**20:.1f} MiB allocated")
+
+def main(argv=None):
+    args = parse_args(argv)
+    overrides = parse_overrides(args.set)
+    if args.sweep:
+        points, replicates, seed = load_design(args.sweep)
+        if args.generations is not None:
+            points = [dict(point, GENERATIONS=args.generations) for point in points]
+        out_dir = args.out or "sweep"
+        run_sweep(points, out_dir, replicates, seed, args.processes, verbose=True)
+        print(f"Sweep summaries in {out_dir}/")
+        return
+    if args.replicates:
+        out_dir = args.out or "replicates"
+        data = run_replicates(args.replicates, generations=args.generations, processes=args.processes,
+                              config=overrides)
+        save_replicates(data, out_dir)
+        print(f"Saved {args.replicates} replicates to {out_dir}/")
+        return
+    
+    if args.shards:
+        out_dir = args.out or "sharded"
+        results = run_sharded(args.shards, args.generations, overrides, migrate_every=args.migrate_every,
+                              migration_rate=args.migration_rate, verbose=True)
+        os.makedirs(out_dir, exist_ok=True)
+        summarize_run(results).to_csv(os.path.join(out_dir, "summary.csv"), index=False)
+        print(f"Saved the sharded run summary to {out_dir}/")
+        return
+    
+    state = load_checkpoint(args.resume) if args.resume else None
+    apply_params(overrides)
+    generations = args.generations if args.generations is not None else core.GENERATIONS
+    kwargs = dict(generations=generations, state=state, checkpoint_dir=args.checkpoint_dir, checkpoint_every=args.checkpoint_every)
+    if args.metrics or args.cprofile:
+        start, stop = map(int, args.cprofile.split(":")) if args.cprofile else (0, 0)
+        kwargs['profiler'] = PhaseProfiler(args.metrics, range(start, stop), args.cprofile_out)
+    if args.telemetry:
+        sink = telemetry_sink(args, state, generations)
+        results = run_simulation(verbose=True, telemetry=sink, **kwargs)
+        results.update(telemetry_results(args.telemetry))
+    else:
+        results = run_simulation(verbose=True, **kwargs)
+    if args.memory_report:
+        print_memory_report(results['population'])
+    report(results, figures_dir=None if args.no_plots else args.figures, show=args.show)
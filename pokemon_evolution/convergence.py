@@ -0,0 +1,44 @@
+"""Steady-state detection for ending runs early.
+
+The monitor reads the per-generation logs only, so it needs no state of its
+own and a resumed run stops exactly where the uninterrupted one would.
+"""
+import numpy as np
+
+MONITORED = ("total_pop", "species_richness", "herbivores", "carnivores", "parasites")
+
+def window_stats(gen_logs, window, fields=MONITORED):
+    """Coefficient of variation and relative trend of each field over the last window generations.
+
+    The trend is the least-squares slope times the window length, relative
+    to the window mean: the fractional drift across the window.
+    """
+    values = np.array([[log[field] for field in fields] for log in gen_logs[-window:]], dtype=float)
+    mean = values.mean(axis=0)
+    scale = np.where(mean > 0, mean, 1.0)
+    t = np.arange(len(values)) - (len(values) - 1) / 2.0
+    slope = t @ (values - mean) / max(t @ t, 1.0)
+    cv = values.std(axis=0) / scale
+    trend = slope * (len(values) - 1) / scale
+    return dict(zip(fields, cv.tolist())), dict(zip(fields, trend.tolist()))
+
+def stop_reason(gen_logs, window, max_cv, max_trend):
+    """Why a run with these logs should stop now, or None to keep going.
+
+    Stops once every monitored series (population, richness and the diet
+    totals) has had a coefficient of variation <= max_cv and a relative
+    trend within +-max_trend over the last window generations, or as soon
+    as the population is gone.
+    """
+    if not gen_logs:
+        return None
+    if gen_logs[-1]['total_pop'] == 0:
+        return "extinct: no individuals left"
+    if len(gen_logs) < window:
+        return None
+    cv, trend = window_stats(gen_logs, window)
+    if all(cv[field] <= max_cv and abs(trend[field]) <= max_trend for field in MONITORED):
+        worst = max(MONITORED, key=lambda field: cv[field])
+        return (f"steady state: every series within CV {max_cv} and trend {max_trend} over the last "
+                f"{window} generations (largest CV {cv[worst]:.4f}, {worst})")
+    return None
@@ -0,0 +1,1707 @@
+"""Simulation core: parameters, species tables, the population store and the generation loop"""
+import json
+import numpy as np
+import pandas as pd
+import random
+import os
+from contextlib import nullcontext
+
+from .data import POKEMON_DATA
+from .spatial import CellIndex, neighbour_table, move
+from .convergence import stop_reason
+
+# Seeds: the module-level one only fixes the import-time diet table; runs
+# draw from the Generators built by make_rngs
+SEED = 42
+random.seed(SEED)
+
+# Simulation parameters
+GENERATIONS = 120
+K_TOTAL = 5000
+K_OPPONENTS = 8
+COMBAT_PHASE_RATIO = 0.4
+REST_PHASE_RATIO = 0.3
+MATING_PHASE_RATIO = 0.3
+PAIR_COMBAT_CHANCE = 0.4
+XP_WIN = 10.0
+XP_PER_LEVEL = 100.0
+LEVEL_GROWTH = 0.02
+SIGMOID_BETA = 0.08
+P_TOTAL = 50000.0
+RESOURCE_MAX = 40.0
+R0 = 10.0
+FOOD_COST = 0.2
+GAMMA_RESOURCE_XP = 0.15
+PREDATION_BIOMASS_FACTOR = 0.8
+MUT_PROB = 0.01
+MUT_SIGMA = 1.0
+MAX_LEVEL_NORMAL = 100
+MAX_LEVEL_LEGENDARY = 150
+LEVEL_DIFF_XP_BONUS = 10
+GENETIC_DRIFT_RATE = 0.02
+COMPACT_DEAD_FRACTION = 0.25  # compact once this share of rows is dead
+COMPACT_INTERVAL = 0          # also compact every N generations (0 = off)
+ARCHIVE_DEAD = False          # keep compacted individuals in a graveyard
+CULL_POLICY = 'xp'            # carrying-capacity cull: 'xp', 'species', 'diet' or 'random'
+COMBAT_MODE = 'sequential'    # combat engine: 'sequential' or 'vectorized'
+GRID_SIZE = 0                 # habitat is a GRID_SIZE x GRID_SIZE torus (0 = well mixed)
+MOVE_PROB = 0.5               # chance to step to an adjacent cell each generation
+RNG_STREAMS = 'shared'        # 'shared': one Generator for the run; 'phase': one per random phase
+GENEALOGY = False             # record every birth: True in memory, or a directory to memory-map the store in
+GENEALOGY_CHUNK = 1 << 20     # rows a memory-mapped genealogy grows by at a time
+STOP_WINDOW = 0               # end a run once it is stationary over this many generations (0 = off)
+STOP_CV = 0.05                # ...i.e. every monitored series has at most this coefficient of variation
+STOP_TREND = 0.05             # ...and at most this relative drift across the window
+POPULATION_LAYOUT = 'standard'  # 'standard' or 'compact' (float32, small ints, derived columns)
+
+prototypes = pd.DataFrame(POKEMON_DATA, columns=[
+    "name", "HP", "Atk", "Def", "SpA", "SpD", "Speed", 
+    "type1", "type2", "egg_group1", "egg_group2"
+])
+prototypes['species_id'] = range(1, len(prototypes) + 1)
+
+types = ["Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting", "Poison",
+         "Ground", "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon", "Steel", "Fairy"]
+type_to_idx = {t: i for i, t in enumerate(types)}
+
+NUM_TYPES = len(types)
+rng = np.random.RandomState(SEED)
+type_adv = rng.normal(loc=0.0, scale=0.12, size=(NUM_TYPES, NUM_TYPES))
+type_adv = np.clip(type_adv, -0.3, 0.3)
+np.fill_diagonal(type_adv, 0.0)
+def type_bonus(typeA_idx, typeB_idx):
+    return type_adv[typeA_idx, typeB_idx]
+def assign_diet(row):
+    type1 = row['type1']
+    name = row['name']    
+    if name in ['Mewtwo', 'Mew', 'Articuno', 'Zapdos', 'Moltres', 'Dragonite']:
+        return 'carnivore'
+    if type1 in ['Poison'] or name in ['Paras', 'Parasect', 'Venonat', 'Venomoth']:
+        return 'parasite'    
+    if type1 in ['Dragon', 'Ghost', 'Dark'] or row['type2'] in ['Dragon', 'Ghost']:
+        return 'carnivore'
+    if name in ['Gyarados', 'Arcanine', 'Charizard', 'Gengar', 'Alakazam']:
+        return 'carnivore'
+    if type1 == 'Fighting' or row['Atk'] > 100:
+        return 'carnivore'
+    if type1 in ['Grass', 'Bug'] or (type1 == 'Normal' and row['Atk'] < 80):
+        return 'herbivore'
+    r = random.random()
+    if r < 0.15:
+        return 'parasite'
+    elif r < 0.45:
+        return 'carnivore'
+    else:
+        return 'herbivore'
+
+prototypes['diet'] = prototypes.apply(assign_diet, axis=1)
+STAT_NAMES = ['HP', 'Atk', 'Def', 'SpA', 'SpD', 'Speed']
+DIETS = ['herbivore', 'carnivore', 'parasite']
+diet_to_idx = {d: i for i, d in enumerate(DIETS)}
+HERBIVORE, CARNIVORE, PARASITE = (diet_to_idx[d] for d in DIETS)
+LEGENDARIES = ['Mewtwo', 'Mew', 'Articuno', 'Zapdos', 'Moltres']
+
+class SpeciesTable:
+    """Prototype DataFrame compiled once into NumPy lookups indexed by species_id"""
+    def __init__(self, protos):
+        sid = protos['species_id'].to_numpy(dtype=np.int64)
+        n = int(sid.max()) + 1
+        self.n_ids = n
+        self.valid = np.zeros(n, dtype=bool)
+        self.valid[sid] = True
+        self.name = np.full(n, '', dtype=object)
+        self.name[sid] = protos['name'].to_numpy()
+        self.stats = np.zeros((n, len(STAT_NAMES)))
+        self.stats[sid] = protos[STAT_NAMES].to_numpy(dtype=float)
+        self.type_idx = np.zeros(n, dtype=np.int64)
+        self.type_idx[sid] = [type_to_idx.get(t, 0) for t in protos['type1']]
+        self.diet = np.zeros(n, dtype=np.int64)
+        self.diet[sid] = [diet_to_idx[d] for d in protos['diet']]
+        self.is_legendary = np.zeros(n, dtype=bool)
+        self.is_legendary[sid] = protos['name'].isin(LEGENDARIES).to_numpy()
+        self.max_level = np.where(self.is_legendary, MAX_LEVEL_LEGENDARY, MAX_LEVEL_NORMAL)
+        # Egg groups as integer codes, -1 for a missing second group
+        egg_columns = protos[['egg_group1', 'egg_group2']].to_numpy()
+        self.egg_group_names = sorted({g for g in egg_columns.ravel() if pd.notna(g)})
+        egg_to_idx = {g: i for i, g in enumerate(self.egg_group_names)}
+        self.egg_groups = np.full((n, 2), -1, dtype=np.int64)
+        self.egg_groups[sid] = [[egg_to_idx[g] if pd.notna(g) else -1 for g in row]
+                                for row in egg_columns]
+        self.breeding = self._breeding_matrix(egg_to_idx)
+
+    def species_named(self, name):
+        """species_id of a named species, or -1 if the table lacks it"""
+        matches = np.flatnonzero(self.name == name)
+        return int(matches[0]) if len(matches) else -1
+
+    def _breeding_matrix(self, egg_to_idx):
+        """Boolean species x species egg-group compatibility"""
+        n, n_groups = self.n_ids, len(self.egg_group_names)
+        # One-hot egg-group membership; the extra last column absorbs -1
+        member = np.zeros((n, n_groups + 1), dtype=bool)
+        member[np.arange(n)[:, None], self.egg_groups] = True
+        member = member[:, :n_groups].astype(np.int32)
+        compatible = (member @ member.T) > 0
+        # Ditto and Mew can breed with anyone...
+        universal = np.isin(self.name, ['Ditto', 'Mew'])
+        compatible |= universal[:, None] | universal[None, :]
+        # ...except Undiscovered (legendaries)
+        undiscovered = self.egg_groups[:, 0] == egg_to_idx.get('Undiscovered', -2)
+        compatible[undiscovered, :] = False
+        compatible[:, undiscovered] = False
+        compatible &= self.valid[:, None] & self.valid[None, :]
+        # Same species always compatible
+        compatible[np.diag_indices(n)] = self.valid
+        return compatible
+
+def load_species_table(protos):
+    """Install a (custom or larger) species table and rebuild every species lookup"""
+    global prototypes, species_table, N_SPECIES_IDS, DITTO_ID, MEW_ID
+    protos = protos.copy()
+    if 'species_id' not in protos:
+        protos['species_id'] = range(1, len(protos) + 1)
+    if 'diet' not in protos:
+        protos['diet'] = protos.apply(assign_diet, axis=1)
+    prototypes = protos
+    species_table = SpeciesTable(protos)
+    N_SPECIES_IDS = species_table.n_ids  # length of species-indexed arrays
+    DITTO_ID = species_table.species_named('Ditto')
+    MEW_ID = species_table.species_named('Mew')
+
+load_species_table(prototypes)
+
+class ColumnStore:
+    """Growable struct-of-arrays table: one contiguous NumPy column per field.
+
+    Columns are exposed as attributes (``pop.xp``, ``pop.base_stats``) that are
+    views over the used rows, so callers update them in place with array ops.
+    Subclasses declare COLUMNS as {name: (dtype, per-row shape)}.
+    """
+    COLUMNS = {}
+
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self._buffers = {name: np.zeros((capacity,) + shape, dtype=dtype)
+                         for name, (dtype, shape) in self.COLUMNS.items()}
+
+    def __getattr__(self, name):
+        buffers = self.__dict__.get('_buffers')
+        if buffers is not None and name in buffers:
+            return buffers[name][:self.size]
+        raise AttributeError(name)
+
+    def __setattr__(self, name, value):
+        if name in self.COLUMNS:
+            self._buffers[name][:self.size] = value
+        else:
+            object.__setattr__(self, name, value)
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def capacity(self):
+        return len(next(iter(self._buffers.values())))
+
+    def _reserve(self, n):
+        """Grow every column (amortized doubling) to hold at least n rows"""
+        if n <= self.capacity:
+            return
+        new_capacity = max(n, 2 * self.capacity)
+        for name, buf in self._buffers.items():
+            grown = np.zeros((new_capacity,) + buf.shape[1:], dtype=buf.dtype)
+            grown[:self.size] = buf[:self.size]
+            self._buffers[name] = grown
+
+    def append(self, columns):
+        """Bulk-append rows given as {column: array}; returns the new row indices"""
+        n = len(columns[next(iter(self.COLUMNS))])
+        start = self.size
+        self._reserve(start + n)
+        for name in self.COLUMNS:
+            self._buffers[name][start:start + n] = columns[name]
+        self.size = start + n
+        return np.arange(start, start + n)
+
+    def extend(self, records):
+        """Bulk-append a list of per-row records"""
+        if not records:
+            return np.arange(self.size, self.size)
+        columns = {name: np.array([rec[name] for rec in records]) for name in self.COLUMNS}
+        return self.append(columns)
+
+    def save(self, out_dir):
+        """Write each column to its own .npy file in out_dir"""
+        os.makedirs(out_dir, exist_ok=True)
+        for name in self.COLUMNS:
+            np.save(os.path.join(out_dir, f"{name}.npy"), getattr(self, name))
+
+    @classmethod
+    def load(cls, out_dir, mmap_mode=None):
+        """Inverse of save(); mmap_mode='r' or 'c' maps the columns instead of reading them"""
+        store = cls(capacity=0)
+        store._buffers = {name: np.load(os.path.join(out_dir, f"{name}.npy"), mmap_mode=mmap_mode)
+                          for name in cls.COLUMNS}
+        store.size = store.capacity
+        return store
+
+    def to_frame(self):
+        """Scalar columns as a DataFrame (matrix columns split per stat)"""
+        data = {}
+        for name, (_, shape) in self.COLUMNS.items():
+            col = getattr(self, name)
+            if shape:
+                for j, stat in enumerate(STAT_NAMES):
+                    data[f"{name}_{stat}"] = col[:, j]
+            else:
+                data[name] = col
+        return pd.DataFrame(data)
+
+class Population(ColumnStore):
+    """Columnar population store.
+
+    A row index identifies an individual until the next compact(), which
+    moves survivors to the front (keeping their relative order) and drops
+    the dead. uid is the permanent identity: append() numbers new rows from
+    next_uid unless they already carry one (e.g. migrants).
+
+    current_stats caches effective_stats: read it through stats(), and call
+    refresh_stats() on rows whose level or base stats change.
+    """
+    COLUMNS = {
+        "uid": (np.int64, ()),
+        "species_id": (np.int64, ()),
+        "type_idx": (np.int64, ()),
+        "diet": (np.int64, ()),
+        "is_legendary": (bool, ()),
+        "max_level": (np.int64, ()),
+        "level": (np.int64, ()),
+        "xp": (np.float64, ()),
+        "resource": (np.float64, ()),
+        "hp": (np.float64, ()),
+        "rest_energy": (np.float64, ()),
+        "mating_readiness": (np.float64, ()),
+        "age": (np.int64, ()),
+        "generation_born": (np.int64, ()),
+        "generation_died": (np.int64, ()),
+        "alive": (bool, ()),
+        "cell": (np.int64, ()),
+        "base_stats": (np.float64, (6,)),
+        "current_stats": (np.float64, (6,)),
+    }
+
+    def __init__(self, capacity=1024):
+        super().__init__(capacity)
+        self.generation = 0
+        self.next_uid = 0
+
+    def append(self, columns):
+        if "uid" not in columns:
+            n = len(columns[next(iter(columns))])
+            columns = dict(columns, uid=np.arange(self.next_uid, self.next_uid + n))
+            self.next_uid += n
+        return super().append(columns)
+
+    def alive_indices(self):
+        return np.flatnonzero(self.alive)
+
+    def count_alive(self):
+        return int(np.count_nonzero(self.alive))
+
+    def kill(self, idx):
+        self.alive[idx] = False
+        self.generation_died[idx] = self.generation
+
+    def stats(self, idx):
+        """Current (level-scaled) stats of rows idx (an index array or a single row)"""
+        return np.take(self.current_stats, idx, axis=0)
+
+    def refresh_stats(self, idx):
+        """Bring current_stats of rows idx up to date after a level change"""
+        self.current_stats[idx] = effective_stats(self, idx)
+
+    def compact(self, graveyard=None):
+        """Reclaim dead rows, archiving them to graveyard if given.
+
+        Returns the old row index of every surviving row.
+        """
+        alive = self.alive
+        if graveyard is not None:
+            graveyard.bury(self, np.flatnonzero(~alive))
+        keep = np.flatnonzero(alive)
+        for buf in self._buffers.values():
+            buf[:len(keep)] = buf[keep]
+        self.size = len(keep)
+        return keep
+
+    def extract(self, idx):
+        """Remove rows idx without archiving them (e.g. emigrants); returns their column values"""
+        rows = {name: getattr(self, name)[idx].copy() for name in self.COLUMNS}
+        keep = np.ones(self.size, dtype=bool)
+        keep[idx] = False
+        keep = np.flatnonzero(keep)
+        for buf in self._buffers.values():
+            buf[:len(keep)] = buf[keep]
+        self.size = len(keep)
+        return rows
+
+class SharedStats:
+    """Read-only (n, 6) base-stat view over rows of a shared stat table.
+
+    Indexing maps the individuals to their table rows first, so pop.base_stats[i, 0]
+    or pop.base_stats[idx] costs only the rows asked for.
+    """
+
+    def __init__(self, table, rows):
+        self.table = table
+        self.rows = rows
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            return self.table[(self.rows[key[0]],) + key[1:]]
+        return self.table[self.rows[key]]
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def shape(self):
+        return (len(self.rows),) + self.table.shape[1:]
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.table[self.rows]
+        return values if dtype is None else values.astype(dtype)
+
+class CompactPopulation(Population):
+    """Population in about a quarter of the memory (POPULATION_LAYOUT='compact').
+
+    State is float32 and counters are small integers. Species traits (type,
+    diet, legendary status, level cap) are looked up from the species table
+    and current_stats from a (prototype, level) table of effective stats, so
+    none of them is stored: hot loops should read them once per phase.
+
+    Base stats are copy-on-write: stats_row points into stat_pool, whose
+    first rows are the species prototypes. Only individuals whose stats
+    differ from their prototype (mutation, drift) get a private row, and
+    compact() drops the private rows of the dead.
+    """
+    COLUMNS = {
+        "uid": (np.int64, ()),
+        "species_id": (np.int16, ()),
+        "level": (np.int16, ()),
+        "xp": (np.float32, ()),
+        "resource": (np.float32, ()),
+        "hp": (np.float32, ()),
+        "rest_energy": (np.float32, ()),
+        "mating_readiness": (np.float32, ()),
+        "age": (np.int32, ()),
+        "generation_born": (np.int32, ()),
+        "generation_died": (np.int32, ()),
+        "alive": (bool, ()),
+        "cell": (np.int32, ()),
+        "stats_row": (np.int32, ()),
+    }
+
+    def __init__(self, capacity=1024):
+        if N_SPECIES_IDS > np.iinfo(np.int16).max + 1:
+            raise ValueError(f"the compact layout holds species ids below 32768, this table has {N_SPECIES_IDS}; "
+                             "use POPULATION_LAYOUT='standard'")
+        super().__init__(capacity)
+        self.stat_pool = species_table.stats.astype(np.float32)
+        self.n_prototypes = len(self.stat_pool)
+
+    def append(self, columns):
+        """Rows given with base_stats values; only those off their prototype get a private stat row"""
+        columns = dict(columns)
+        base_stats = np.asarray(columns.pop('base_stats'), dtype=np.float32)
+        rows = np.asarray(columns['species_id'], dtype=np.int32).copy()
+        private = np.flatnonzero((base_stats != self.stat_pool[rows]).any(axis=1))
+        rows[private] = len(self.stat_pool) + np.arange(len(private), dtype=np.int32)
+        self.stat_pool = np.concatenate([self.stat_pool, base_stats[private]])
+        columns['stats_row'] = rows
+        return super().append(columns)
+
+    def compact(self, graveyard=None):
+        keep = super().compact(graveyard)
+        rows = self.stats_row
+        private = np.flatnonzero(rows >= self.n_prototypes)
+        self.stat_pool = np.concatenate([self.stat_pool[:self.n_prototypes], self.stat_pool[rows[private]]])
+        rows[private] = self.n_prototypes + np.arange(len(private), dtype=np.int32)
+        return keep
+
+    def extract(self, idx):
+        base_stats = self.base_stats[idx]
+        rows = super().extract(idx)
+        del rows['stats_row']
+        rows['base_stats'] = base_stats
+        return rows
+
+    def save(self, out_dir):
+        super().save(out_dir)
+        np.save(os.path.join(out_dir, "stat_pool.npy"), self.stat_pool)
+
+    @classmethod
+    def load(cls, out_dir, mmap_mode=None):
+        store = super().load(out_dir, mmap_mode)
+        store.stat_pool = np.load(os.path.join(out_dir, "stat_pool.npy"))
+        return store
+
+    @property
+    def base_stats(self):
+        return SharedStats(self.stat_pool, self.stats_row)
+
+    @property
+    def type_idx(self):
+        return species_table.type_idx[self.species_id]
+
+    @property
+    def diet(self):
+        return species_table.diet[self.species_id]
+
+    @property
+    def is_legendary(self):
+        return species_table.is_legendary[self.species_id]
+
+    @property
+    def max_level(self):
+        return species_table.max_level[self.species_id]
+
+    @property
+    def current_stats(self):
+        return self.stats(np.arange(self.size))
+
+    def stats(self, idx):
+        """Effective stats looked up from a (prototype, level) table; private stat rows are scaled directly"""
+        rows = np.take(self.stats_row, idx)
+        level = np.take(self.level, idx)
+        if np.ndim(rows) == 0:
+            return effective_stats(self, idx)
+        table = self._level_stats(int(level.max(initial=0)) + 1)
+        n_levels = len(table) // self.n_prototypes
+        out = np.take(table, np.minimum(rows, self.n_prototypes - 1) * n_levels + level, axis=0)
+        private = np.flatnonzero(rows >= self.n_prototypes)
+        if len(private):
+            growth = 1.0 + LEVEL_GROWTH * (level[private] - 1)
+            out[private] = self.stat_pool[rows[private]] * np.expand_dims(growth, -1)
+        return out
+
+    def _level_stats(self, n_levels):
+        """Effective stats of every (prototype, level) pair as rows prototype * n_levels + level.
+
+        Rebuilt when LEVEL_GROWTH or the level range changes.
+        """
+        n_levels = max(n_levels, MAX_LEVEL_NORMAL + 1, MAX_LEVEL_LEGENDARY + 1)
+        table = self.__dict__.get('_level_table')
+        if table is None or self._level_growth != LEVEL_GROWTH or len(table) < self.n_prototypes * n_levels:
+            growth = 1.0 + LEVEL_GROWTH * (np.arange(n_levels) - 1)
+            table = (self.stat_pool[:self.n_prototypes, None, :] * growth[:, None]).reshape(-1, 6)
+            self._level_table = table
+            self._level_growth = LEVEL_GROWTH
+        return table
+
+    def refresh_stats(self, idx):
+        pass  # the level table is keyed by level
+
+POPULATION_LAYOUTS = {'standard': Population, 'compact': CompactPopulation}
+
+def population_class():
+    """Population store class for POPULATION_LAYOUT"""
+    if POPULATION_LAYOUT not in POPULATION_LAYOUTS:
+        raise ValueError(f"Unknown population layout: {POPULATION_LAYOUT!r}")
+    return POPULATION_LAYOUTS[POPULATION_LAYOUT]
+
+def memory_report(pop):
+    """Bytes per individual of each stored column, plus the total.
+
+    attrs holds the used and allocated bytes, including tables shared
+    between individuals (the compact layout's stat_pool).
+    """
+    rows = [(name, np.dtype(dtype).name, np.dtype(dtype).itemsize * int(np.prod(shape, dtype=np.int64)))
+            for name, (dtype, shape) in pop.COLUMNS.items()]
+    table = pd.DataFrame(rows, columns=["column", "dtype", "bytes_per_individual"])
+    per_individual = int(table['bytes_per_individual'].sum())
+    table.loc[len(table)] = ["total", "", per_individual]
+    pool = getattr(pop, 'stat_pool', None)
+    shared = 0 if pool is None else pool.nbytes
+    table.attrs = {"individuals": len(pop), "capacity": pop.capacity, "shared_bytes": shared,
+                   "used_bytes": per_individual * len(pop) + shared,
+                   "allocated_bytes": per_individual * pop.capacity + shared}
+    return table
+
+class Graveyard(ColumnStore):
+    """Append-only archive of dead individuals, kept small for later analysis"""
+    COLUMNS = {
+        "uid": (np.int64, ()),
+        "species_id": (np.int32, ()),
+        "generation_born": (np.int32, ()),
+        "generation_died": (np.int32, ()),
+        "age": (np.int32, ()),
+        "level": (np.int16, ()),
+        "xp": (np.float32, ()),
+        "base_stats": (np.float32, (6,)),
+    }
+
+    def bury(self, pop, idx):
+        return self.append({name: getattr(pop, name)[idx] for name in self.COLUMNS})
+
+class Genealogy(ColumnStore):
+    """Append-only birth register: one row per individual, in uid order.
+
+    Founders have parent ids -1. stats_delta is the child's base stats minus
+    its parents' mean (mutation and drift), so lineages can be traced
+    without the dead themselves. Saved and memory-mapped like any
+    ColumnStore; Genealogy.mapped(dir) builds it in .npy files on disk
+    instead of RAM. See genealogy.py for the queries.
+    """
+    COLUMNS = {
+        "child_id": (np.int64, ()),
+        "parent1_id": (np.int64, ()),
+        "parent2_id": (np.int64, ()),
+        "generation_born": (np.int32, ()),
+        "species_id": (np.int32, ()),
+        "stats_delta": (np.float32, (6,)),
+    }
+    out_dir = None  # set by mapped()
+
+    @classmethod
+    def mapped(cls, out_dir, chunk=None):
+        """Empty store backed by memory-mapped .npy files in out_dir, grown chunk rows at a time.
+
+        flush() records the row count, so Genealogy.load(out_dir) reads back
+        the rows written so far.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+        store = cls(capacity=0)
+        store.out_dir = out_dir
+        store.chunk = chunk or GENEALOGY_CHUNK
+        store._remap(store.chunk)
+        return store
+
+    def _remap(self, capacity):
+        for name, (dtype, shape) in self.COLUMNS.items():
+            path = os.path.join(self.out_dir, f"{name}.npy")
+            grown = np.lib.format.open_memmap(path + ".tmp", mode='w+', dtype=dtype, shape=(capacity,) + shape)
+            grown[:self.size] = self._buffers[name][:self.size]
+            os.replace(path + ".tmp", path)
+            self._buffers[name] = grown
+        self.flush()
+
+    def _reserve(self, n):
+        if self.out_dir is None:
+            return super()._reserve(n)
+        if n > self.capacity:
+            self._remap(-(-n // self.chunk) * self.chunk)
+
+    def flush(self):
+        """Write a memory-mapped store's rows to disk (no-op in memory)"""
+        if self.out_dir is None:
+            return
+        for buf in self._buffers.values():
+            buf.flush()
+        with open(os.path.join(self.out_dir, "rows.json"), "w") as f:
+            json.dump({"rows": self.size}, f)
+
+    @classmethod
+    def load(cls, out_dir, mmap_mode=None):
+        store = super().load(out_dir, mmap_mode)
+        rows_path = os.path.join(out_dir, "rows.json")
+        if os.path.exists(rows_path):
+            with open(rows_path) as f:
+                store.size = json.load(f)['rows']
+        return store
+
+    def record_founders(self, pop, rows):
+        n = len(rows)
+        return self.append({
+            "child_id": pop.uid[rows],
+            "parent1_id": np.full(n, -1),
+            "parent2_id": np.full(n, -1),
+            "generation_born": pop.generation_born[rows],
+            "species_id": pop.species_id[rows],
+            "stats_delta": np.zeros((n, 6)),
+        })
+
+    def record_births(self, pop, rows, parents1, parents2):
+        midparent = (pop.base_stats[parents1] + pop.base_stats[parents2]) / 2.0
+        return self.append({
+            "child_id": pop.uid[rows],
+            "parent1_id": pop.uid[parents1],
+            "parent2_id": pop.uid[parents2],
+            "generation_born": pop.generation_born[rows],
+            "species_id": pop.species_id[rows],
+            "stats_delta": pop.base_stats[rows] - midparent,
+        })
+
+def new_individuals(species_ids, generation_born=0):
+    """Column values for a batch of fresh level-1 individuals, one per species id"""
+    species_ids = np.asarray(species_ids, dtype=np.int64)
+    n = len(species_ids)
+    base_stats = species_table.stats[species_ids]
+    return {
+        "species_id": species_ids,
+        "base_stats": base_stats,
+        "current_stats": base_stats,  # level 1: equal to base_stats (copied on append)
+        "hp": base_stats[:, 0].copy(),
+        "level": np.ones(n, dtype=np.int64),
+        "xp": np.zeros(n),
+        "resource": np.full(n, R0),
+        "diet": species_table.diet[species_ids],
+        "type_idx": species_table.type_idx[species_ids],
+        "age": np.zeros(n, dtype=np.int64),
+        "alive": np.ones(n, dtype=bool),
+        "is_legendary": species_table.is_legendary[species_ids],
+        "max_level": species_table.max_level[species_ids],
+        "rest_energy": np.full(n, 100.0),
+        "mating_readiness": np.full(n, 50.0),
+        "generation_born": np.full(n, generation_born, dtype=np.int64),
+        "generation_died": np.full(n, -1, dtype=np.int64),
+        "cell": np.zeros(n, dtype=np.int64)
+    }
+
+def new_offspring(species_ids, gen_num, rng):
+    """Newborns of a generation, with mutation and drift drawn for the whole batch"""
+    children = new_individuals(species_ids, gen_num)
+    base_stats = children['base_stats']
+    n = len(base_stats)
+    rolls = rng.random((n, 2))
+    # Genetic drift and mutation
+    mutants = np.flatnonzero(rolls[:, 0] < MUT_PROB)
+    base_stats[mutants] += rng.normal(0, MUT_SIGMA, size=(len(mutants), 6))
+    base_stats[mutants] = np.maximum(base_stats[mutants], 1.0)
+    # Random drift
+    drifters = np.flatnonzero(rolls[:, 1] < GENETIC_DRIFT_RATE)
+    base_stats[drifters] += rng.normal(0, 0.5, size=(len(drifters), 6))
+    base_stats[drifters] = np.maximum(base_stats[drifters], 1.0)
+    # current_stats shares base_stats, so it already holds the mutated values
+    children['hp'] = base_stats[:, 0].copy()
+    return children
+
+def initial_population(rng):
+    """Initialize population (3-5 of each species)"""
+    # Legendaries only get 1, regular Pokémon get 3-5
+    counts = np.where(prototypes['name'].isin(LEGENDARIES), 1, rng.integers(3, 6, size=len(prototypes)))
+    pop = population_class()()
+    pop.append(new_individuals(np.repeat(prototypes['species_id'].to_numpy(), counts)))
+    if GRID_SIZE:
+        pop.cell = rng.integers(GRID_SIZE * GRID_SIZE, size=len(pop))
+    return pop
+
+# Helper functions
+def _untimed(name, pop=None):
+    return nullcontext()
+
+def effective_stats(pop, i):
+    """Level-scaled stats of one individual (6,) or of an index array (n, 6), computed afresh.
+
+    Phases read the cached values through pop.stats() instead.
+    """
+    growth = 1.0 + LEVEL_GROWTH * (pop.level[i] - 1)
+    return pop.base_stats[i] * np.expand_dims(growth, -1)
+
+def battle_prob_batch(pop, a, b, ally_a=None, ally_b=None, rest_a=None):
+    """Vectorized battle_prob over arrays of matchups.
+
+    ally_a/ally_b hold an ally index per matchup or -1 for "no ally";
+    rest_a overrides the attackers' rest_energy (e.g. a snapshot taken at
+    matchmaking time).
+    """
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    A_stats = pop.stats(a)
+    B_stats = pop.stats(b)
+    w_atk, w_spa, w_spd = 0.5, 0.4, 0.1
+    s = (w_atk * (A_stats[:, 1] - B_stats[:, 2]) +
+         w_spa * (A_stats[:, 3] - B_stats[:, 4]) +
+         w_spd * (A_stats[:, 5] - B_stats[:, 5]))
+    type_a, type_b = pop.type_idx[a], pop.type_idx[b]
+    s += type_adv[type_a, type_b] * 40.0
+    if rest_a is None:
+        rest_a = pop.rest_energy[a]
+    s += (rest_a / 100.0) * 10.0
+    if ally_a is not None:
+        ally_a = np.asarray(ally_a, dtype=np.int64)
+        has = np.flatnonzero(ally_a >= 0)
+        ally_stats = pop.stats(ally_a[has])
+        s[has] += (ally_stats[:, 1] + ally_stats[:, 3]) * 0.15
+        s[has] += type_adv[pop.type_idx[ally_a[has]], type_b[has]] * 15.0
+    
+    if ally_b is not None:
+        ally_b = np.asarray(ally_b, dtype=np.int64)
+        has = np.flatnonzero(ally_b >= 0)
+        opp_stats = pop.stats(ally_b[has])
+        s[has] -= (opp_stats[:, 1] + opp_stats[:, 3]) * 0.15
+        s[has] -= type_adv[pop.type_idx[ally_b[has]], type_a[has]] * 15.0
+    
+    p = 1.0 / (1.0 + np.exp(-np.clip(SIGMOID_BETA * s, -500, 500)))
+    return np.clip(p, 0.05, 0.95)
+
+def battle_prob(pop, a, b, ally_a=-1, ally_b=-1):
+    """Battle probability with type advantages and ally support (-1 = no ally)"""
+    return battle_prob_batch(pop, [a], [b], [ally_a], [ally_b])[0]
+# Egg group compatibility
+def can_breed(sid1, sid2):
+    """Check if two species can breed based on egg groups"""
+    return species_table.breeding[sid1, sid2]
+# Ecology functions
+def move_phase(pop, rng):
+    """Local movement on the habitat grid (no-op in a well-mixed world)"""
+    if GRID_SIZE:
+        idx = pop.alive_indices()
+        pop.cell[idx] = move(pop.cell[idx], GRID_SIZE, MOVE_PROB, rng)
+
+def n_cells():
+    return max(1, GRID_SIZE * GRID_SIZE)
+
+def forage_plants(pop):
+    """Herbivores gather plant resources"""
+    herbivores = np.flatnonzero(pop.alive & (pop.diet == HERBIVORE))
+    if len(herbivores) == 0:
+        return
+    eff = pop.stats(herbivores)
+    scores = eff[:, 5] + 0.1 * eff[:, 3]
+    scores = np.maximum(scores, 0.1)
+    if GRID_SIZE:
+        # Every cell grows an equal share of the plants, split among its own herbivores
+        cells = pop.cell[herbivores]
+        shares = scores / np.bincount(cells, weights=scores, minlength=n_cells())[cells] * (P_TOTAL / n_cells())
+    else:
+        shares = (scores / scores.sum()) * P_TOTAL
+    pop.resource[herbivores] = np.minimum(RESOURCE_MAX, pop.resource[herbivores] + shares / 100.0)
+def attempt_predation(pop, pred, prey, rolls, ally_pred=-1, ally_prey=-1, p_kill=None):
+    """Carnivore hunts prey; rolls are two uniforms (the hunt, the ally's counter-damage)"""
+    if p_kill is None:
+        p_kill = battle_prob(pop, pred, prey, ally_pred, ally_prey)
+    if rolls[0] < p_kill:
+        # Successful hunt
+        biomass_gain = PREDATION_BIOMASS_FACTOR * pop.base_stats[prey, 0]
+        pop.resource[pred] += biomass_gain / 100.0
+        if ally_pred >= 0 and pop.alive[ally_pred]:
+            pop.resource[ally_pred] += biomass_gain / 200.0
+        xp_gain = XP_WIN * 2.0
+        if pop.level[prey] - pop.level[pred] >= LEVEL_DIFF_XP_BONUS:
+            xp_gain *= 2.0
+        pop.xp[pred] += xp_gain
+        if ally_pred >= 0 and pop.alive[ally_pred]:
+            pop.xp[ally_pred] += xp_gain * 0.6
+        pop.kill(prey)
+        return True
+    else:
+        # Prey fights back
+        damage = max(0.5, 0.01 * pop.base_stats[prey, 1])
+        pop.hp[pred] -= damage
+        if pop.hp[pred] <= 0:
+            pop.kill(pred)
+        if ally_pred >= 0 and pop.alive[ally_pred] and rolls[1] < 0.3:
+            pop.hp[ally_pred] -= damage * 0.5
+            if pop.hp[ally_pred] <= 0:
+                pop.kill(ally_pred)
+        
+        return False
+def parasite_action(pop, parasite, host, roll, p_attach=None):
+    """Parasite drains resources from host given a uniform roll; returns whether it attached"""
+    if p_attach is None:
+        p_attach = battle_prob(pop, parasite, host) * 0.6
+    if roll < p_attach and pop.alive[host]:
+        drain = min(0.5 + 0.02 * pop.level[parasite], pop.resource[host])
+        pop.resource[host] -= drain
+        pop.resource[parasite] += drain
+        pop.xp[parasite] += drain * 0.5
+        pop.resource[host] = max(0, pop.resource[host])
+        return True
+    return False
+
+def rest_phase(pop):
+    """Individuals rest and recover"""
+    idx = pop.alive_indices()
+    base_recovery = 10.0
+    resource_factor = np.minimum(1.0, pop.resource[idx] / RESOURCE_MAX)
+    recovery = base_recovery * (0.5 + 0.5 * resource_factor)
+    
+    pop.rest_energy[idx] = np.minimum(100.0, pop.rest_energy[idx] + recovery)
+    
+    rested = idx[pop.rest_energy[idx] > 80.0]
+    pop.hp[rested] = np.minimum(pop.stats(rested)[:, 0], pop.hp[rested] + 0.5)
+
+def mating_phase(pop):
+    """Individuals build mating readiness"""
+    idx = pop.alive_indices()
+    base_gain = 8.0
+    resource_factor = np.minimum(1.0, pop.resource[idx] / RESOURCE_MAX)
+    energy_factor = pop.rest_energy[idx] / 100.0
+    gain = base_gain * (0.3 + 0.4 * resource_factor + 0.3 * energy_factor)
+    
+    pop.mating_readiness[idx] = np.minimum(100.0, pop.mating_readiness[idx] + gain)
+
+def upkeep_phase(pop):
+    """Update stats, level up, maintenance costs"""
+    idx = pop.alive_indices()
+    # Level up
+    new_level = (pop.xp[idx] / XP_PER_LEVEL).astype(np.int64) + 1
+    pop.level[idx] = np.maximum(1, np.minimum(new_level, pop.max_level[idx]))
+    pop.refresh_stats(idx)
+    # HP recovery
+    hp = np.minimum(pop.stats(idx)[:, 0], pop.hp[idx] + np.minimum(0.1 * pop.resource[idx], 0.5))
+    # Food cost
+    resource = pop.resource[idx] - FOOD_COST
+    pop.resource[idx] = resource
+    starving = resource < 0
+    hp[starving] -= 0.5 + np.abs(resource[starving]) * 0.1
+    pop.xp[idx[starving]] *= 0.995
+    # Exhaustion penalty
+    hp[pop.rest_energy[idx] < 30.0] -= 0.2
+    pop.hp[idx] = hp
+    # Death check
+    pop.kill(idx[hp <= 0])
+    pop.age[idx] += 1
+
+def fitness_scores(pop, idx):
+    return np.maximum(0.1, pop.resource[idx] * pop.level[idx] * (pop.mating_readiness[idx] / 100.0))
+
+class CandidatePool:
+    """Row indices grouped by key with O(1) uniform draws and O(1) removal.
+
+    Each key owns a contiguous segment of one flat list; removing a member
+    swaps it with the last live entry of its segment. Draws consume uniforms
+    from rng in batches.
+    """
+    def __init__(self, members, keys, n_rows, rng):
+        members = np.asarray(members, dtype=np.int64)
+        keys = np.asarray(keys, dtype=np.int64)
+        order = np.argsort(keys, kind='stable')
+        uniq, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+        self._items = members[order].tolist()
+        self._start = dict(zip(uniq.tolist(), starts.tolist()))
+        self._size = dict(zip(uniq.tolist(), counts.tolist()))
+        pos = np.full(n_rows, -1, dtype=np.int64)
+        pos[members[order]] = np.arange(len(members))
+        key_of = np.full(n_rows, -1, dtype=np.int64)
+        key_of[members] = keys
+        self._pos = pos.tolist()
+        self._key_of = key_of.tolist()
+        self._rng = rng
+        self._uniforms = []
+
+    def _uniform(self):
+        if not self._uniforms:
+            self._uniforms = self._rng.random(max(64, len(self._items))).tolist()
+        return self._uniforms.pop()
+
+    def __contains__(self, i):
+        return self._pos[i] >= 0
+
+    def size(self, key):
+        return self._size.get(key, 0)
+
+    def discard(self, i):
+        """Remove a member (paired up or dead); no-op if absent"""
+        p = self._pos[i]
+        if p < 0:
+            return
+        key = self._key_of[i]
+        last = self._start[key] + self._size[key] - 1
+        moved = self._items[last]
+        self._items[p] = moved
+        self._pos[moved] = p
+        self._items[last] = i
+        self._pos[i] = -1
+        self._size[key] -= 1
+
+    def draw(self, key, exclude=()):
+        """Uniform random member of a key's pool outside exclude, or -1 if none"""
+        size = self.size(key)
+        excluded = {e for e in exclude if e >= 0 and self._pos[e] >= 0 and self._key_of[e] == key}
+        if size <= len(excluded):
+            return -1
+        start = self._start[key]
+        while True:
+            i = self._items[start + int(self._uniform() * size)]
+            if i not in excluded:
+                return i
+
+def pair_breeders(pop, breeders, rng):
+    """Fitness-weighted mate pairing in O(n log n); returns (parents1, parents2).
+
+    One Gumbel-top-k pass ranks the breeders as successive fitness-weighted
+    draws without replacement (resource x level x readiness). Walking that
+    ranking, each free individual becomes a first parent and takes the
+    best-ranked free compatible mate, so weights are never recomputed.
+    """
+    breeders = np.asarray(breeders)
+    keys = np.log(fitness_scores(pop, breeders)) + rng.gumbel(size=len(breeders))
+    ranked = breeders[np.argsort(-keys, kind='stable')]
+    ranked_species = pop.species_id[ranked]
+    # Rank positions of each species' members, consumed front to back
+    queues = {int(sid): np.flatnonzero(ranked_species == sid).tolist()
+              for sid in np.unique(ranked_species)}
+    heads = dict.fromkeys(queues, 0)
+    taken = np.zeros(len(ranked), dtype=bool)
+    parents1, parents2 = [], []
+    pos = 0
+    for _ in range(len(ranked) // 2):
+        while pos < len(ranked) and taken[pos]:
+            pos += 1
+        if pos >= len(ranked):
+            break
+        taken[pos] = True
+        first = pos
+        # Best-ranked free member among the compatible species
+        mate = -1
+        for sid, queue in queues.items():
+            if not can_breed(ranked_species[first], sid):
+                continue
+            head = heads[sid]
+            while head < len(queue) and taken[queue[head]]:
+                head += 1
+            heads[sid] = head
+            if head < len(queue) and (mate < 0 or queue[head] < mate):
+                mate = queue[head]
+        if mate < 0:
+            continue
+        taken[mate] = True
+        parents1.append(ranked[first])
+        parents2.append(ranked[mate])
+    return np.array(parents1, dtype=np.int64), np.array(parents2, dtype=np.int64)
+
+def pair_breeders_by_cell(pop, breeders, rng):
+    """Mate pairing on a habitat grid; returns (parents1, parents2).
+
+    As pair_breeders, walking one Gumbel-top-k fitness ranking, but mates
+    must share a species and live in the same or a neighbouring cell: each
+    free individual takes the best-ranked free member of the (species, cell)
+    queues around it, so the cost is linear in the breeders.
+    """
+    breeders = np.asarray(breeders, dtype=np.int64)
+    if len(breeders) < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    keys = np.log(fitness_scores(pop, breeders)) + rng.gumbel(size=len(breeders))
+    ranked = breeders[np.argsort(-keys, kind='stable')]
+    groups = pop.species_id[ranked].astype(np.int64) * n_cells() + pop.cell[ranked]
+    # Rank positions of each (species, cell) group, consumed front to back
+    order = np.argsort(groups, kind='stable')
+    bounds = np.flatnonzero(np.r_[True, groups[order][1:] != groups[order][:-1], True])
+    queues = {int(groups[order[a]]): order[a:b].tolist() for a, b in zip(bounds[:-1], bounds[1:])}
+    heads = dict.fromkeys(queues, 0)
+    neighbours = neighbour_table(GRID_SIZE).tolist()
+    cells = pop.cell[ranked].tolist()
+    species_base = (pop.species_id[ranked].astype(np.int64) * n_cells()).tolist()
+    taken = [False] * len(ranked)
+    parents1, parents2 = [], []
+    for first in range(len(ranked)):
+        if taken[first]:
+            continue
+        taken[first] = True
+        mate = -1
+        for cell in neighbours[cells[first]]:
+            group = species_base[first] + cell
+            queue = queues.get(group)
+            if queue is None:
+                continue
+            head = heads[group]
+            while head < len(queue) and taken[queue[head]]:
+                head += 1
+            heads[group] = head
+            if head < len(queue) and (mate < 0 or queue[head] < mate):
+                mate = queue[head]
+        if mate < 0:
+            continue
+        taken[mate] = True
+        parents1.append(ranked[first])
+        parents2.append(ranked[mate])
+    return np.array(parents1, dtype=np.int64), np.array(parents2, dtype=np.int64)
+
+def offspring_species(s1, s2, rng):
+    """Species of each pair's child: parent 1's, unless Ditto or Mew is involved"""
+    # Ditto (then Mew) breeds -> 40% its own species, 60% other parent
+    keep_other = rng.random(len(s1)) > 0.4
+    return np.select(
+        [s1 == DITTO_ID, s2 == DITTO_ID, s1 == MEW_ID, s2 == MEW_ID],
+        [np.where(keep_other, s2, s1), np.where(keep_other, s1, s2),
+         np.where(keep_other, s2, s1), np.where(keep_other, s1, s2)],
+        default=s1)
+
+def _distinct_draws(rng, n, k, rows):
+    """rows x k draws from range(n), without replacement within each row"""
+    if n <= 4 * k:
+        return np.argsort(rng.random((rows, n)), axis=1)[:, :k]
+    # Batched rejection: collisions are rare when k is small next to n
+    draws = rng.integers(n, size=(rows, k))
+    while True:
+        ordered = np.sort(draws, axis=1)
+        clash = np.flatnonzero((ordered[:, 1:] == ordered[:, :-1]).any(axis=1))
+        if len(clash) == 0:
+            return draws
+        draws[clash] = rng.integers(n, size=(len(clash), k))
+
+def combat_phase(pop, rng, phase=_untimed):
+    """Matchmake every combatant, score all encounters in one batch, then resolve them.
+
+    Random numbers are drawn up front in pre-sized batches (one slot per
+    combatant and encounter), so the per-individual loops only index them.
+    Matchmaking (the ally and opponent search) is timed as "combat_matchmaking".
+    Returns event counts for the generation (battles, ally pairings, predations, attachments).
+    """
+    with phase("combat_matchmaking"):
+        alive_combat = pop.alive_indices()
+        alive_list = alive_combat.tolist()
+        # Diet is a species trait, so the "same species or same diet" candidates
+        # are exactly the same-diet ones: diet-keyed pools serve both rules.
+        # On a habitat grid the pools are per cell (key = diet x cell).
+        pool_keys = pop.diet * n_cells() + pop.cell
+        pool_of = pool_keys.tolist()
+        unpaired = CandidatePool(alive_combat, pool_keys[alive_combat], len(pop), rng)
+        combatants = CandidatePool(alive_combat, pool_keys[alive_combat], len(pop), rng)
+        n = len(alive_list)
+        encounters = min(int(K_OPPONENTS * COMBAT_PHASE_RATIO), n)
+        ally_rolls = rng.random(n).tolist()
+        if GRID_SIZE:
+            # Opponents come from the 3x3 neighbourhood of the attacker's cell
+            residents = CellIndex(alive_combat, pop.cell[alive_combat], n_cells())
+            cells = np.repeat(pop.cell[alive_combat], encounters)
+            sampled_all = residents.sample(neighbour_table(GRID_SIZE)[cells], rng).reshape(n, encounters)
+        else:
+            sampled_all = alive_combat[_distinct_draws(rng, n, encounters, n)]
+        sampled_all = sampled_all.tolist()
+        opp_ally_rolls = rng.random((n, encounters)).tolist()
+    
+        # Matchmaking: allies, opponents and opponent allies for the whole generation
+        turns = []
+        attackers, opponents, allies, opp_allies, attacker_rest = [], [], [], [], []
+        for t, ind in enumerate(alive_list):
+            if ind not in unpaired:
+                continue
+        
+            # Find ally
+            ally = -1
+            if ally_rolls[t] < PAIR_COMBAT_CHANCE:
+                ally = unpaired.draw(pool_of[ind], exclude=(ind,))
+                if ally >= 0:
+                    unpaired.discard(ind)
+                    unpaired.discard(ally)
+        
+            pop.rest_energy[ind] = max(0.0, pop.rest_energy[ind] - 5.0 * encounters)
+            if ally >= 0:
+                pop.rest_energy[ally] = max(0.0, pop.rest_energy[ally] - 5.0 * encounters)
+        
+            # Combat encounters
+            first = len(attackers)
+            for opp, roll in zip(sampled_all[t], opp_ally_rolls[t]):
+                if opp == ind or opp == ally:
+                    continue
+            
+                # Opponent ally
+                opp_ally = -1
+                if roll < PAIR_COMBAT_CHANCE * 0.7:
+                    opp_ally = combatants.draw(pool_of[opp], exclude=(opp, ind, ally))
+            
+                attackers.append(ind)
+                opponents.append(opp)
+                allies.append(ally)
+                opp_allies.append(opp_ally)
+                attacker_rest.append(pop.rest_energy[ind])
+            turns.append((ind, ally, first, len(attackers)))
+    events = {"battles": len(attackers), "ally_pairings": sum(ally >= 0 for _, ally, _, _ in turns),
+              "predations_attempted": 0, "predations_succeeded": 0, "parasite_attachments": 0}
+    if not attackers:
+        return events
+    
+    # Scoring: every encounter of the generation in one pass
+    attackers = np.array(attackers)
+    opponents = np.array(opponents)
+    attacker_rest = np.array(attacker_rest)
+    p_win = battle_prob_batch(pop, attackers, opponents, allies, opp_allies, rest_a=attacker_rest)
+    # Parasites attach alone, without ally support
+    p_attach = np.zeros(len(attackers))
+    drains = np.flatnonzero((pop.diet[attackers] == PARASITE) & (pop.diet[opponents] != PARASITE))
+    p_attach[drains] = battle_prob_batch(pop, attackers[drains], opponents[drains],
+                                         rest_a=attacker_rest[drains]) * 0.6
+    
+    # Resolution, in matchmaking order
+    opponents = opponents.tolist()
+    diet = pop.diet.tolist()
+    rolls = rng.random((len(attackers), 2)).tolist()
+    for ind, ally, first, last in turns:
+        if not pop.alive[ind]:
+            continue
+        expected_xp = 0.0
+        for r in range(first, last):
+            opp = opponents[r]
+            if not pop.alive[opp]:
+                continue
+            
+            # Diet-based interactions
+            if diet[ind] == CARNIVORE and diet[opp] in (HERBIVORE, PARASITE):
+                events["predations_attempted"] += 1
+                events["predations_succeeded"] += attempt_predation(pop, ind, opp, rolls[r], ally,
+                                                                    opp_allies[r], p_kill=p_win[r])
+            elif diet[ind] == PARASITE and diet[opp] != PARASITE:
+                events["parasite_attachments"] += parasite_action(pop, ind, opp, rolls[r][0],
+                                                                  p_attach=p_attach[r])
+            
+            # Calculate XP from battle
+            xp_from_battle = XP_WIN * p_win[r]
+            if pop.level[opp] - pop.level[ind] >= LEVEL_DIFF_XP_BONUS:
+                xp_from_battle *= 2.0
+            if ally >= 0:
+                xp_from_battle *= 1.15
+            expected_xp += xp_from_battle
+            if ally >= 0 and pop.alive[ally]:
+                pop.xp[ally] += xp_from_battle * 0.5
+        # Apply XP with resource bonus
+        rfrac = min(1.0, pop.resource[ind] / RESOURCE_MAX)
+        pop.xp[ind] += expected_xp * (1.0 + GAMMA_RESOURCE_XP * rfrac)
+    return events
+
+def _scatter_add(target, idx, values):
+    """target[idx] += values with repeated indices accumulated (one bincount pass)"""
+    target += np.bincount(idx, weights=values, minlength=len(target))[:len(target)]
+
+def combat_phase_vectorized(pop, rng, phase=_untimed):
+    """Combat with the generation's whole encounter table drawn and resolved as arrays.
+
+    Each diet group (within a cell on a habitat grid) is shuffled into
+    consecutive pairs, some of which fight together (the ally sometimes
+    giving up its own turn). Every turn samples its opponents with replacement.
+    Conflicts are settled by a random priority over encounters: an encounter
+    only happens if neither side was killed by a higher-priority one, so each
+    prey falls to the first successful hunt. Counter-damage and parasite
+    drains are summed per target and applied once, so predators die of their
+    wounds (and hosts run dry) at the end of the phase. Returns the same event
+    counts as combat_phase, and times the encounter table's construction as
+    "combat_matchmaking".
+    """
+    events = dict.fromkeys(["battles", "ally_pairings", "predations_attempted",
+                            "predations_succeeded", "parasite_attachments"], 0)
+    alive = pop.alive_indices()
+    n = len(alive)
+    k = min(int(K_OPPONENTS * COMBAT_PHASE_RATIO), n)
+    if k == 0:
+        return events
+    
+    with phase("combat_matchmaking"):
+        # Ally pairs: consecutive members of each shuffled diet group (per cell on a grid)
+        pool_keys = pop.diet * n_cells() + pop.cell
+        order = np.lexsort((rng.random(n), pool_keys[alive]))
+        grouped = alive[order]
+        grouped_key = pool_keys[grouped]
+        all_keys = np.arange(len(DIETS) * n_cells())
+        group_start = np.searchsorted(grouped_key, all_keys)
+        group_size = np.searchsorted(grouped_key, all_keys, side='right') - group_start
+        pos = np.arange(n)
+        rank = pos - group_start[grouped_key]
+        # Sequential matchmaking recruits allies from everyone still unpaired, about
+        # half of whom already had their turn: this pairing rate and a 50% chance
+        # of the ally keeping its own turn match its expected pairs and turns.
+        pair_rate = min(1.0, 4.0 * PAIR_COMBAT_CHANCE / (2.0 + PAIR_COMBAT_CHANCE))
+        lead = (rank % 2 == 0) & (rank + 1 < group_size[grouped_key]) & (rng.random(n) < pair_rate)
+        follower = np.zeros(n, dtype=bool)
+        follower[pos[lead] + 1] = rng.random(int(lead.sum())) < 0.5
+        turn_pos = pos[~follower]
+        turns = grouped[turn_pos]
+        turn_ally = np.where(lead[turn_pos], grouped[np.minimum(turn_pos + 1, n - 1)], -1)
+        events["ally_pairings"] = int(lead.sum())
+        pop.rest_energy[turns] = np.maximum(0.0, pop.rest_energy[turns] - 5.0 * k)
+        paired_allies = turn_ally[turn_ally >= 0]
+        pop.rest_energy[paired_allies] = np.maximum(0.0, pop.rest_energy[paired_allies] - 5.0 * k)
+    
+        # Encounter table
+        owner = np.repeat(turns, k)
+        ally = np.repeat(turn_ally, k)
+        if GRID_SIZE:
+            residents = CellIndex(alive, pop.cell[alive], n_cells())
+            opp = residents.sample(neighbour_table(GRID_SIZE)[pop.cell[owner]], rng)
+        else:
+            opp = alive[rng.integers(n, size=len(owner))]
+        keep = (opp != owner) & (opp != ally)
+        owner, ally, opp = owner[keep], ally[keep], opp[keep]
+        n_enc = len(owner)
+        events["battles"] = n_enc
+        if n_enc == 0:
+            return events
+        opp_diet = pop.diet[opp]
+        opp_key = pool_keys[opp]
+        rolls = rng.random((n_enc, 4))
+        opp_ally = grouped[group_start[opp_key] + (rolls[:, 0] * group_size[opp_key]).astype(np.int64)]
+        clash = (opp_ally == opp) | (opp_ally == owner) | (opp_ally == ally)
+        opp_ally[clash | (rolls[:, 1] >= PAIR_COMBAT_CHANCE * 0.7)] = -1
+    
+    # Scoring
+    rest = pop.rest_energy[owner]
+    p_win = battle_prob_batch(pop, owner, opp, ally, opp_ally, rest_a=rest)
+    owner_diet = pop.diet[owner]
+    hunt = (owner_diet == CARNIVORE) & (opp_diet != CARNIVORE)
+    drain = (owner_diet == PARASITE) & (opp_diet != PARASITE)
+    p_attach = np.zeros(n_enc)
+    p_attach[drain] = battle_prob_batch(pop, owner[drain], opp[drain], rest_a=rest[drain]) * 0.6
+    roll = rolls[:, 2]
+    
+    # Conflict rule: carnivores are never prey, so kill times need no iteration
+    priority = rng.permutation(n_enc)
+    kill_time = np.full(len(pop), n_enc)
+    success = hunt & (roll < p_win)
+    np.minimum.at(kill_time, opp[success], priority[success])
+    live = (priority < kill_time[owner]) & (priority <= kill_time[opp])
+    has_ally = ally >= 0
+    
+    # Predation
+    kills = success & live
+    biomass = PREDATION_BIOMASS_FACTOR * pop.base_stats[opp[kills], 0]
+    xp_gain = np.where(pop.level[opp[kills]] - pop.level[owner[kills]] >= LEVEL_DIFF_XP_BONUS,
+                       XP_WIN * 4.0, XP_WIN * 2.0)
+    _scatter_add(pop.resource, owner[kills], biomass / 100.0)
+    _scatter_add(pop.xp, owner[kills], xp_gain)
+    helped = has_ally[kills]
+    _scatter_add(pop.resource, ally[kills][helped], biomass[helped] / 200.0)
+    _scatter_add(pop.xp, ally[kills][helped], xp_gain[helped] * 0.6)
+    failed = hunt & live & ~success
+    damage = np.maximum(0.5, 0.01 * pop.base_stats[opp[failed], 1])
+    _scatter_add(pop.hp, owner[failed], -damage)
+    hit = has_ally[failed] & (rolls[failed, 3] < 0.3)
+    _scatter_add(pop.hp, ally[failed][hit], -0.5 * damage[hit])
+    events["predations_attempted"] = int((hunt & live).sum())
+    events["predations_succeeded"] = int(kills.sum())
+    
+    # Parasite drains, scaled down where a host cannot cover them all
+    attach = drain & live & (roll < p_attach)
+    amount = 0.5 + 0.02 * pop.level[owner[attach]]
+    demand = np.bincount(opp[attach], weights=amount, minlength=len(pop))
+    supply = np.maximum(0.0, pop.resource)
+    scale = np.ones(len(pop))
+    short = demand > supply
+    scale[short] = supply[short] / demand[short]
+    amount *= scale[opp[attach]]
+    _scatter_add(pop.resource, opp[attach], -amount)
+    _scatter_add(pop.resource, owner[attach], amount)
+    _scatter_add(pop.xp, owner[attach], amount * 0.5)
+    events["parasite_attachments"] = int(attach.sum())
+    
+    # Battle XP
+    xp = XP_WIN * p_win
+    xp[pop.level[opp] - pop.level[owner] >= LEVEL_DIFF_XP_BONUS] *= 2.0
+    xp[has_ally] *= 1.15
+    ally_live = live & has_ally
+    ally_live[ally_live] &= priority[ally_live] < kill_time[ally[ally_live]]
+    _scatter_add(pop.xp, ally[ally_live], xp[ally_live] * 0.5)
+    expected = np.bincount(owner[live], weights=xp[live], minlength=len(pop))
+    fought = np.flatnonzero(expected)
+    rfrac = np.minimum(1.0, pop.resource[fought] / RESOURCE_MAX)
+    pop.xp[fought] += expected[fought] * (1.0 + GAMMA_RESOURCE_XP * rfrac)
+    
+    # Deaths: prey first, then fighters whose wounds were fatal
+    pop.kill(np.unique(opp[kills]))
+    wounded = np.unique(np.concatenate([owner[failed], ally[failed][hit]]))
+    pop.kill(wounded[pop.alive[wounded] & (pop.hp[wounded] <= 0)])
+    return events
+
+COMBAT_ENGINES = {'sequential': combat_phase, 'vectorized': combat_phase_vectorized}
+
+def run_combat(pop, rng, mode=None, phase=_untimed):
+    """Combat phase with the engine chosen by COMBAT_MODE (or mode)"""
+    mode = COMBAT_MODE if mode is None else mode
+    if mode not in COMBAT_ENGINES:
+        raise ValueError(f"Unknown combat mode: {mode!r}")
+    return COMBAT_ENGINES[mode](pop, rng, phase)
+
+def aggregate_species(pop, n_ids=None):
+    """Per-species totals over the living in one grouped (bincount) pass.
+
+    Returns species-indexed arrays: entry sid describes species sid, and
+    absent species have zero count.
+    """
+    idx = pop.alive_indices()
+    sid = pop.species_id[idx]
+    if n_ids is None:
+        n_ids = N_SPECIES_IDS
+    if len(sid):
+        n_ids = max(n_ids, int(sid.max()) + 1)
+    count = np.bincount(sid, minlength=n_ids)
+    stats = pop.stats(idx)
+    stat_sums = np.column_stack([np.bincount(sid, weights=stats[:, j], minlength=n_ids)
+                                 for j in range(stats.shape[1])])
+    level = pop.level[idx]
+    max_level = np.zeros(n_ids, dtype=level.dtype)
+    np.maximum.at(max_level, sid, level)
+    level_sums = np.bincount(sid, weights=level, minlength=n_ids)
+    agg = {
+        "count": count,
+        "total_biomass": stat_sums.sum(axis=1),
+        "total_xp": np.bincount(sid, weights=pop.xp[idx], minlength=n_ids),
+        "mean_level": level_sums / np.maximum(count, 1),
+        "max_level": max_level,
+        "stat_sums": stat_sums,
+    }
+    for j, stat in enumerate(STAT_NAMES):
+        agg[stat] = stat_sums[:, j]
+    return agg
+
+def _lowest(values, k):
+    """Positions of the k smallest values (argpartition, linear time)"""
+    if k >= len(values):
+        return np.arange(len(values))
+    return np.argpartition(values, k - 1)[:k]
+
+def _quota_cull(groups, xp, capacity):
+    """Cull each group down to its proportional share of capacity, lowest XP first"""
+    counts = np.bincount(groups)
+    share = capacity * counts / counts.sum()
+    keep = np.floor(share).astype(np.int64)
+    # Largest-remainder rounding so the quotas add up to capacity
+    short = capacity - keep.sum()
+    if short > 0:
+        keep[_lowest(keep - share, short)] += 1
+    cull = counts - keep
+    # Stable argsort of 16-bit keys is a radix sort, so grouping stays linear
+    keys = groups.astype(np.int16) if counts.size <= np.iinfo(np.int16).max else groups
+    order = np.argsort(keys, kind='stable')
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    victims = [np.zeros(0, dtype=np.int64)]
+    for g in np.flatnonzero(cull > 0):
+        members = order[bounds[g]:bounds[g + 1]]
+        victims.append(members[_lowest(xp[members], cull[g])])
+    return np.concatenate(victims)
+
+def cull_to_capacity(pop, rng, capacity=None, policy=None):
+    """Kill the living in excess of K_TOTAL; returns the cull count per species.
+
+    Policies: 'xp' kills the lowest-XP individuals, 'species' and 'diet'
+    cut every species (or diet) to its proportional share of capacity,
+    lowest XP first, and 'random' culls uniformly. All run in linear time.
+    """
+    capacity = K_TOTAL if capacity is None else capacity
+    policy = CULL_POLICY if policy is None else policy
+    alive = pop.alive_indices()
+    excess = len(alive) - capacity
+    culled = np.zeros(0, dtype=np.int64)
+    if excess > 0:
+        if policy == 'xp':
+            culled = alive[_lowest(pop.xp[alive], excess)]
+        elif policy == 'species':
+            culled = alive[_quota_cull(pop.species_id[alive], pop.xp[alive], capacity)]
+        elif policy == 'diet':
+            culled = alive[_quota_cull(pop.diet[alive], pop.xp[alive], capacity)]
+        elif policy == 'random':
+            culled = rng.choice(alive, size=excess, replace=False)
+        else:
+            raise ValueError(f"Unknown cull policy: {policy!r}")
+        pop.kill(culled)
+    return np.bincount(pop.species_id[culled], minlength=N_SPECIES_IDS)
+
+def maybe_compact(pop, gen_num, graveyard=None):
+    """Compact the population periodically or once enough rows are dead"""
+    dead = len(pop) - pop.count_alive()
+    if dead == 0:
+        return False
+    periodic = COMPACT_INTERVAL > 0 and (gen_num + 1) % COMPACT_INTERVAL == 0
+    if periodic or dead >= COMPACT_DEAD_FRACTION * len(pop):
+        pop.compact(graveyard)
+        return True
+    return False
+
+def reproduction_phase(pop, gen_num, rng, genealogy=None):
+    """Pair ready breeders within each species and append their offspring; returns the new rows
+
+    With a Genealogy, every child is recorded with its parents' uids.
+    """
+    alive_idx = pop.alive_indices()
+    alive_species = pop.species_id[alive_idx]
+    if GRID_SIZE:
+        # Legendaries don't breed
+        fertile = ~species_table.is_legendary[alive_species] | np.isin(alive_species, (DITTO_ID, MEW_ID))
+        breeders = alive_idx[fertile & (pop.mating_readiness[alive_idx] >= 40.0)]
+        parents1, parents2 = pair_breeders_by_cell(pop, breeders, rng)
+    else:
+        species_ids = np.unique(alive_species)
+        parents1, parents2 = [], []
+        # Process each species
+        for sid in species_ids:
+            # Legendaries don't breed
+            if species_table.is_legendary[sid] and sid not in (DITTO_ID, MEW_ID):
+                continue
+            inds = alive_idx[alive_species == sid]
+            viable_breeders = inds[pop.mating_readiness[inds] >= 40.0]
+            if len(viable_breeders) < 2:
+                continue
+            # Create breeding pairs considering egg groups
+            p1, p2 = pair_breeders(pop, viable_breeders, rng)
+            parents1.append(p1)
+            parents2.append(p2)
+        parents1 = np.concatenate(parents1) if parents1 else np.zeros(0, dtype=np.int64)
+        parents2 = np.concatenate(parents2) if parents2 else np.zeros(0, dtype=np.int64)
+    # Breeding success
+    parents = np.concatenate([parents1, parents2])
+    pop.mating_readiness[parents] = np.maximum(0.0, pop.mating_readiness[parents] - 20.0)
+    offspring = offspring_species(pop.species_id[parents1], pop.species_id[parents2], rng)
+    
+    children = new_offspring(offspring, gen_num, rng)
+    # Offspring are born in the first parent's cell
+    children['cell'] = pop.cell[parents1]
+    rows = pop.append(children)
+    if genealogy is not None:
+        genealogy.record_births(pop, rows, parents1, parents2)
+    return rows
+
+def interaction_phases(pop, gen_num, rngs, genealogy=None, phase=_untimed):
+    """Foraging through reproduction on one population (or shard); returns the combat events"""
+    # Phase 1: Foraging
+    with phase("forage"):
+        forage_plants(pop)
+    
+    # Phase 2: Combat
+    with phase("combat", pop):
+        events = run_combat(pop, rngs['combat'], phase=phase)
+    # Phase 3: Rest
+    with phase("rest"):
+        rest_phase(pop)
+    # Phase 4: Mating/Socializing
+    with phase("mating"):
+        mating_phase(pop)
+    # Update stats, level up, maintenance costs
+    with phase("upkeep", pop):
+        upkeep_phase(pop)
+    # Phase 5: Reproduction with egg groups
+    with phase("reproduction", pop):
+        reproduction_phase(pop, gen_num, rngs['reproduction'], genealogy)
+    return events
+
+def close_generation(pop, gen_num, rngs, graveyard=None, capacity=None, phase=_untimed):
+    """Carrying capacity, species aggregation and compaction; returns the species aggregates"""
+    # Carrying capacity
+    with phase("carrying_capacity", pop):
+        culled = cull_to_capacity(pop, rngs['carrying_capacity'], capacity)
+    
+    # Aggregate statistics
+    with phase("aggregation"):
+        species_agg = aggregate_species(pop)
+        species_agg['culled'] = culled
+    
+    # Reclaim dead rows so the next generation only walks the living
+    with phase("compaction"):
+        maybe_compact(pop, gen_num, graveyard)
+    return species_agg
+
+# Main generation loop
+def run_generation(pop, gen_num, rngs, graveyard=None, profiler=None, genealogy=None):
+    """Advance the population by one generation; returns the species aggregates.
+
+    rngs (from make_rngs) holds the Generator of each random phase.
+    profiler (see profiling.PhaseProfiler) times each phase and records event
+    counts; without one the phases run bare.
+    """
+    pop.generation = gen_num
+    if profiler is not None:
+        profiler.start_generation(gen_num)
+        phase = profiler.phase
+    else:
+        phase = _untimed
+    # Phase 0: Movement on the habitat grid
+    with phase("movement"):
+        move_phase(pop, rngs['movement'])
+    events = interaction_phases(pop, gen_num, rngs, genealogy, phase)
+    species_agg = close_generation(pop, gen_num, rngs, graveyard, phase=phase)
+    if profiler is not None:
+        profiler.end_generation(events)
+    return species_agg
+
+# Random streams
+RNG_PHASES = ("setup", "movement", "combat", "reproduction", "carrying_capacity")
+
+def make_rngs(seed=SEED, streams=None):
+    """Generators for a run's random phases, keyed by RNG_PHASES.
+
+    seed is an int or a SeedSequence. RNG_STREAMS (or streams) 'shared' draws
+    every phase from one Generator; 'phase' gives each phase its own child of
+    the seed, so a change in how much one phase draws leaves the others'
+    numbers untouched.
+    """
+    streams = RNG_STREAMS if streams is None else streams
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    if streams == 'shared':
+        return dict.fromkeys(RNG_PHASES, np.random.default_rng(seed))
+    if streams == 'phase':
+        return dict(zip(RNG_PHASES, (np.random.default_rng(child) for child in seed.spawn(len(RNG_PHASES)))))
+    raise ValueError(f"Unknown RNG stream layout: {streams!r}")
+
+# Parameter overrides
+SIM_PARAMS = [
+    "GENERATIONS", "K_TOTAL", "K_OPPONENTS", "COMBAT_PHASE_RATIO", "REST_PHASE_RATIO",
+    "MATING_PHASE_RATIO", "PAIR_COMBAT_CHANCE", "XP_WIN", "XP_PER_LEVEL", "LEVEL_GROWTH",
+    "SIGMOID_BETA", "P_TOTAL", "RESOURCE_MAX", "R0", "FOOD_COST", "GAMMA_RESOURCE_XP",
+    "PREDATION_BIOMASS_FACTOR", "MUT_PROB", "MUT_SIGMA", "MAX_LEVEL_NORMAL",
+    "MAX_LEVEL_LEGENDARY", "LEVEL_DIFF_XP_BONUS", "GENETIC_DRIFT_RATE",
+    "COMPACT_DEAD_FRACTION", "COMPACT_INTERVAL", "ARCHIVE_DEAD", "CULL_POLICY", "COMBAT_MODE",
+    "GRID_SIZE", "MOVE_PROB", "RNG_STREAMS", "GENEALOGY", "GENEALOGY_CHUNK", "STOP_WINDOW", "STOP_CV",
+    "STOP_TREND", "POPULATION_LAYOUT",
+]
+DEFAULT_PARAMS = {name: globals()[name] for name in SIM_PARAMS}
+
+def apply_params(params):
+    """Override simulation parameters (module globals); returns the previous values"""
+    unknown = set(params) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown simulation parameters: {sorted(unknown)}")
+    previous = {name: globals()[name] for name in params}
+    globals().update(params)
+    # Level caps are baked into the species table
+    if {"MAX_LEVEL_NORMAL", "MAX_LEVEL_LEGENDARY"} & set(params):
+        load_species_table(prototypes)
+    return previous
+
+# Run simulation
+def run_simulation(config=None, generations=None, seed=None, verbose=False, telemetry=None,
+                   state=None, checkpoint_dir=None, checkpoint_every=0, profiler=None):
+    """Run one trajectory from a fresh population; returns its final state and time series
+
+    config maps parameter names (SIM_PARAMS) to values used for this run only.
+    species_time_series (biomass) and species_count_series are preallocated
+    (generation, species_id) matrices filled in place (see analysis.py).
+    With a TelemetryWriter they are streamed to disk instead of being kept
+    in memory (use telemetry_results to load them back).
+    state (from load_checkpoint) resumes a run; checkpoint_every > 0 writes a
+    snapshot to checkpoint_dir/gen-NNNNNN every that many generations.
+    profiler is handed to run_generation and closed at the end of the run.
+    With STOP_WINDOW > 0 the run ends early once it is stationary (see
+    convergence.stop_reason); state['stopped'] then records when and why.
+
+    Reproducibility: every random draw comes from make_rngs(seed) (seed
+    defaults to SEED), so the same seed, parameters and NumPy version give
+    the same trajectory in any process and regardless of other runs. With
+    RNG_STREAMS='phase' each random phase has its own stream.
+    """
+    previous = apply_params(config or {})
+    try:
+        return _simulate(generations, seed, verbose, telemetry, state, checkpoint_dir, checkpoint_every,
+                         profiler)
+    finally:
+        apply_params(previous)
+
+SERIES_DTYPES = {"species_time_series": np.float64, "species_count_series": np.int64}
+
+def species_series(generations):
+    """Empty (generation, species_id) matrices for the biomass and count series"""
+    return {key: np.zeros((generations, N_SPECIES_IDS), dtype=dtype) for key, dtype in SERIES_DTYPES.items()}
+
+def _with_rows(matrix, rows):
+    """matrix with at least rows rows, zero-padded (a resumed run going further than planned)"""
+    if len(matrix) >= rows:
+        return matrix
+    grown = np.zeros((rows,) + matrix.shape[1:], dtype=matrix.dtype)
+    grown[:len(matrix)] = matrix
+    return grown
+
+def generation_log(g, counts):
+    """One gen_logs entry: population, richness and diet totals from the species counts"""
+    diets = np.bincount(species_table.diet[:len(counts)], weights=counts, minlength=len(DIETS))
+    log = {"gen": g, "total_pop": int(counts.sum()), "species_richness": int(np.count_nonzero(counts))}
+    for code, diet in enumerate(DIETS):
+        log[diet + "s"] = int(diets[code])
+    return log
+
+def _simulate(generations, seed, verbose, telemetry, state, checkpoint_dir, checkpoint_every, profiler):
+    if generations is None:
+        generations = GENERATIONS
+    if state is None:
+        rngs = make_rngs(SEED if seed is None else seed)
+        population = initial_population(rngs['setup'])
+        genealogy = None
+        if isinstance(GENEALOGY, str):
+            genealogy = Genealogy.mapped(GENEALOGY)
+        elif GENEALOGY:
+            genealogy = Genealogy()
+        if genealogy is not None:
+            genealogy.record_founders(population, np.arange(len(population)))
+        state = {
+            "generation": 0,
+            "population": population,
+            "graveyard": Graveyard() if ARCHIVE_DEAD else None,
+            "genealogy": genealogy,
+            "rngs": rngs,
+            "gen_logs": [],
+            "extinction_events": {},
+            "stopped": None,
+        }
+        # Streamed to disk instead when telemetry is on
+        state.update(dict.fromkeys(SERIES_DTYPES) if telemetry is not None else species_series(generations))
+    elif telemetry is None and state['species_time_series'] is None:
+        # Resuming a telemetry run in memory: the series so far are in its stream
+        from .telemetry import telemetry_results
+        streamed = telemetry_results(state['telemetry']['dir'])
+        state.update({key: streamed[key][:state['generation']] for key in SERIES_DTYPES})
+    population = state['population']
+    if not population.alive.flags.writeable:
+        raise ValueError("state was loaded with mmap_mode='r' (read-only); load it with mmap_mode='c' to resume it")
+    # Parameters may have changed since a checkpoint was written (e.g. LEVEL_GROWTH)
+    population.refresh_stats(np.arange(len(population)))
+    graveyard = state['graveyard']
+    genealogy = state['genealogy']
+    if isinstance(GENEALOGY, str) and genealogy is not None and genealogy.out_dir is None:
+        # A resumed run carries on in a memory-mapped store
+        mapped = Genealogy.mapped(GENEALOGY)
+        mapped.append({name: getattr(genealogy, name) for name in Genealogy.COLUMNS})
+        genealogy = state['genealogy'] = mapped
+    rngs = state['rngs']
+    gen_logs = state['gen_logs']
+    state['telemetry'] = None if telemetry is None else {"dir": telemetry.out_dir, "format": telemetry.fmt}
+    if telemetry is None:
+        for key in SERIES_DTYPES:
+            state[key] = _with_rows(state[key], generations)
+    species_time_series = state['species_time_series']
+    species_count_series = state['species_count_series']
+    extinction_events = state['extinction_events']
+    valid_species = species_table.valid
+    if verbose:
+        print(f"Initial population size: {len(population)}")
+        print(f"Species count: {len(prototypes)}")
+        print(f"Diet distribution: {prototypes['diet'].value_counts().to_dict()}")
+        print("\n🎮 Starting Pokémon Evolution Simulation\n")
+    
+    for g in range(state['generation'], generations):
+        agg = run_generation(population, g, rngs, graveyard, profiler, genealogy)
+        
+        counts = agg['count'][:N_SPECIES_IDS]
+        
+        # Track extinctions
+        for sid in np.flatnonzero(valid_species & (counts == 0)).tolist():
+            extinction_events.setdefault(sid, g)
+        
+        # Log generation
+        gen_logs.append(generation_log(g, counts))
+        total_pop = gen_logs[-1]['total_pop']
+        species_richness = gen_logs[-1]['species_richness']
+        
+        # Time series
+        if telemetry is not None:
+            telemetry.write(g, agg, gen_logs[-1])
+        else:
+            species_time_series[g] = agg['total_biomass'][:N_SPECIES_IDS]
+            species_count_series[g] = counts
+        
+        state['generation'] = g + 1
+        if checkpoint_every and (g + 1) % checkpoint_every == 0:
+            from .checkpoint import save_checkpoint
+            if telemetry is not None:
+                telemetry.flush()  # the snapshot refers to the stream up to g + 1
+            save_checkpoint(os.path.join(checkpoint_dir, f"gen-{g + 1:06d}"), state, g + 1)
+        
+        if verbose and ((g + 1) % 20 == 0 or g == 0):
+            print(f"Gen {g+1}/{generations} - Pop: {total_pop}, Species: {species_richness}")
+        
+        # Early termination once the run has settled
+        reason = stop_reason(gen_logs, STOP_WINDOW, STOP_CV, STOP_TREND) if STOP_WINDOW else None
+        if reason is not None:
+            state['stopped'] = {"generation": g + 1, "reason": reason}
+            if verbose:
+                print(f"Stopping after generation {g + 1}: {reason}")
+            break
+    
+    if genealogy is not None:
+        genealogy.flush()
+    if telemetry is not None:
+        telemetry.close()
+    else:
+        for key in SERIES_DTYPES:
+            state[key] = state[key][:state['generation']]
+    if profiler is not None:
+        profiler.close()
+    if verbose:
+        print("\n✅ Simulation Complete!\n")
+    return state
@@ -0,0 +1,155 @@
+# Real Gen 1 Pokémon data (all 151)
+POKEMON_DATA = [
+    # Format: [Name, HP, Atk, Def, SpA, SpD, Speed, Type1, Type2, EggGroup1, EggGroup2]
+    ["Bulbasaur", 45, 49, 49, 65, 65, 45, "Grass", "Poison", "Monster", "Grass"],
+    ["Ivysaur", 60, 62, 63, 80, 80, 60, "Grass", "Poison", "Monster", "Grass"],
+    ["Venusaur", 80, 82, 83, 100, 100, 80, "Grass", "Poison", "Monster", "Grass"],
+    ["Charmander", 39, 52, 43, 60, 50, 65, "Fire", None, "Monster", "Dragon"],
+    ["Charmeleon", 58, 64, 58, 80, 65, 80, "Fire", None, "Monster", "Dragon"],
+    ["Charizard", 78, 84, 78, 109, 85, 100, "Fire", "Flying", "Monster", "Dragon"],
+    ["Squirtle", 44, 48, 65, 50, 64, 43, "Water", None, "Monster", "Water1"],
+    ["Wartortle", 59, 63, 80, 65, 80, 58, "Water", None, "Monster", "Water1"],
+    ["Blastoise", 79, 83, 100, 85, 105, 78, "Water", None, "Monster", "Water1"],
+    ["Caterpie", 45, 30, 35, 20, 20, 45, "Bug", None, "Bug", None],
+    ["Metapod", 50, 20, 55, 25, 25, 30, "Bug", None, "Bug", None],
+    ["Butterfree", 60, 45, 50, 90, 80, 70, "Bug", "Flying", "Bug", None],
+    ["Weedle", 40, 35, 30, 20, 20, 50, "Bug", "Poison", "Bug", None],
+    ["Kakuna", 45, 25, 50, 25, 25, 35, "Bug", "Poison", "Bug", None],
+    ["Beedrill", 65, 90, 40, 45, 80, 75, "Bug", "Poison", "Bug", None],
+    ["Pidgey", 40, 45, 40, 35, 35, 56, "Normal", "Flying", "Flying", None],
+    ["Pidgeotto", 63, 60, 55, 50, 50, 71, "Normal", "Flying", "Flying", None],
+    ["Pidgeot", 83, 80, 75, 70, 70, 101, "Normal", "Flying", "Flying", None],
+    ["Rattata", 30, 56, 35, 25, 35, 72, "Normal", None, "Field", None],
+    ["Raticate", 55, 81, 60, 50, 70, 97, "Normal", None, "Field", None],
+    ["Spearow", 40, 60, 30, 31, 31, 70, "Normal", "Flying", "Flying", None],
+    ["Fearow", 65, 90, 65, 61, 61, 100, "Normal", "Flying", "Flying", None],
+    ["Ekans", 35, 60, 44, 40, 54, 55, "Poison", None, "Field", "Dragon"],
+    ["Arbok", 60, 95, 69, 65, 79, 80, "Poison", None, "Field", "Dragon"],
+    ["Pikachu", 35, 55, 40, 50, 50, 90, "Electric", None, "Field", "Fairy"],
+    ["Raichu", 60, 90, 55, 90, 80, 110, "Electric", None, "Field", "Fairy"],
+    ["Sandshrew", 50, 75, 85, 20, 30, 40, "Ground", None, "Field", None],
+    ["Sandslash", 75, 100, 110, 45, 55, 65, "Ground", None, "Field", None],
+    ["Nidoran♀", 55, 47, 52, 40, 40, 41, "Poison", None, "Monster", "Field"],
+    ["Nidorina", 70, 62, 67, 55, 55, 56, "Poison", None, "Undiscovered", None],
+    ["Nidoqueen", 90, 92, 87, 75, 85, 76, "Poison", "Ground", "Undiscovered", None],
+    ["Nidoran♂", 46, 57, 40, 40, 40, 50, "Poison", None, "Monster", "Field"],
+    ["Nidorino", 61, 72, 57, 55, 55, 65, "Poison", None, "Monster", "Field"],
+    ["Nidoking", 81, 102, 77, 85, 75, 85, "Poison", "Ground", "Monster", "Field"],
+    ["Clefairy", 70, 45, 48, 60, 65, 35, "Fairy", None, "Fairy", None],
+    ["Clefable", 95, 70, 73, 95, 90, 60, "Fairy", None, "Fairy", None],
+    ["Vulpix", 38, 41, 40, 50, 65, 65, "Fire", None, "Field", None],
+    ["Ninetales", 73, 76, 75, 81, 100, 100, "Fire", None, "Field", None],
+    ["Jigglypuff", 115, 45, 20, 45, 25, 20, "Fairy", None, "Fairy", None],
+    ["Wigglytuff", 140, 70, 45, 85, 50, 45, "Fairy", None, "Fairy", None],
+    ["Zubat", 40, 45, 35, 30, 40, 55, "Poison", "Flying", "Flying", None],
+    ["Golbat", 75, 80, 70, 65, 75, 90, "Poison", "Flying", "Flying", None],
+    ["Oddish", 45, 50, 55, 75, 65, 30, "Grass", "Poison", "Grass", None],
+    ["Gloom", 60, 65, 70, 85, 75, 40, "Grass", "Poison", "Grass", None],
+    ["Vileplume", 75, 80, 85, 110, 90, 50, "Grass", "Poison", "Grass", None],
+    ["Paras", 35, 70, 55, 45, 55, 25, "Bug", "Grass", "Bug", "Grass"],
+    ["Parasect", 60, 95, 80, 60, 80, 30, "Bug", "Grass", "Bug", "Grass"],
+    ["Venonat", 60, 55, 50, 40, 55, 45, "Bug", "Poison", "Bug", None],
+    ["Venomoth", 70, 65, 60, 90, 75, 90, "Bug", "Poison", "Bug", None],
+    ["Diglett", 10, 55, 25, 35, 45, 95, "Ground", None, "Field", None],
+    ["Dugtrio", 35, 100, 50, 50, 70, 120, "Ground", None, "Field", None],
+    ["Meowth", 40, 45, 35, 40, 40, 90, "Normal", None, "Field", None],
+    ["Persian", 65, 70, 60, 65, 65, 115, "Normal", None, "Field", None],
+    ["Psyduck", 50, 52, 48, 65, 50, 55, "Water", None, "Water1", "Field"],
+    ["Golduck", 80, 82, 78, 95, 80, 85, "Water", None, "Water1", "Field"],
+    ["Mankey", 40, 80, 35, 35, 45, 70, "Fighting", None, "Field", None],
+    ["Primeape", 65, 105, 60, 60, 70, 95, "Fighting", None, "Field", None],
+    ["Growlithe", 55, 70, 45, 70, 50, 60, "Fire", None, "Field", None],
+    ["Arcanine", 90, 110, 80, 100, 80, 95, "Fire", None, "Field", None],
+    ["Poliwag", 40, 50, 40, 40, 40, 90, "Water", None, "Water1", None],
+    ["Poliwhirl", 65, 65, 65, 50, 50, 90, "Water", None, "Water1", None],
+    ["Poliwrath", 90, 95, 95, 70, 90, 70, "Water", "Fighting", "Water1", None],
+    ["Abra", 25, 20, 15, 105, 55, 90, "Psychic", None, "Human-Like", None],
+    ["Kadabra", 40, 35, 30, 120, 70, 105, "Psychic", None, "Human-Like", None],
+    ["Alakazam", 55, 50, 45, 135, 95, 120, "Psychic", None, "Human-Like", None],
+    ["Machop", 70, 80, 50, 35, 35, 35, "Fighting", None, "Human-Like", None],
+    ["Machoke", 80, 100, 70, 50, 60, 45, "Fighting", None, "Human-Like", None],
+    ["Machamp", 90, 130, 80, 65, 85, 55, "Fighting", None, "Human-Like", None],
+    ["Bellsprout", 50, 75, 35, 70, 30, 40, "Grass", "Poison", "Grass", None],
+    ["Weepinbell", 65, 90, 50, 85, 45, 55, "Grass", "Poison", "Grass", None],
+    ["Victreebel", 80, 105, 65, 100, 70, 70, "Grass", "Poison", "Grass", None],
+    ["Tentacool", 40, 40, 35, 50, 100, 70, "Water", "Poison", "Water3", None],
+    ["Tentacruel", 80, 70, 65, 80, 120, 100, "Water", "Poison", "Water3", None],
+    ["Geodude", 40, 80, 100, 30, 30, 20, "Rock", "Ground", "Mineral", None],
+    ["Graveler", 55, 95, 115, 45, 45, 35, "Rock", "Ground", "Mineral", None],
+    ["Golem", 80, 120, 130, 55, 65, 45, "Rock", "Ground", "Mineral", None],
+    ["Ponyta", 50, 85, 55, 65, 65, 90, "Fire", None, "Field", None],
+    ["Rapidash", 65, 100, 70, 80, 80, 105, "Fire", None, "Field", None],
+    ["Slowpoke", 90, 65, 65, 40, 40, 15, "Water", "Psychic", "Monster", "Water1"],
+    ["Slowbro", 95, 75, 110, 100, 80, 30, "Water", "Psychic", "Monster", "Water1"],
+    ["Magnemite", 25, 35, 70, 95, 55, 45, "Electric", "Steel", "Mineral", None],
+    ["Magneton", 50, 60, 95, 120, 70, 70, "Electric", "Steel", "Mineral", None],
+    ["Farfetchd", 52, 90, 55, 58, 62, 60, "Normal", "Flying", "Flying", "Field"],
+    ["Doduo", 35, 85, 45, 35, 35, 75, "Normal", "Flying", "Flying", None],
+    ["Dodrio", 60, 110, 70, 60, 60, 110, "Normal", "Flying", "Flying", None],
+    ["Seel", 65, 45, 55, 45, 70, 45, "Water", None, "Water1", "Field"],
+    ["Dewgong", 90, 70, 80, 70, 95, 70, "Water", "Ice", "Water1", "Field"],
+    ["Grimer", 80, 80, 50, 40, 50, 25, "Poison", None, "Amorphous", None],
+    ["Muk", 105, 105, 75, 65, 100, 50, "Poison", None, "Amorphous", None],
+    ["Shellder", 30, 65, 100, 45, 25, 40, "Water", None, "Water3", None],
+    ["Cloyster", 50, 95, 180, 85, 45, 70, "Water", "Ice", "Water3", None],
+    ["Gastly", 30, 35, 30, 100, 35, 80, "Ghost", "Poison", "Amorphous", None],
+    ["Haunter", 45, 50, 45, 115, 55, 95, "Ghost", "Poison", "Amorphous", None],
+    ["Gengar", 60, 65, 60, 130, 75, 110, "Ghost", "Poison", "Amorphous", None],
+    ["Onix", 35, 45, 160, 30, 45, 70, "Rock", "Ground", "Mineral", None],
+    ["Drowzee", 60, 48, 45, 43, 90, 42, "Psychic", None, "Human-Like", None],
+    ["Hypno", 85, 73, 70, 73, 115, 67, "Psychic", None, "Human-Like", None],
+    ["Krabby", 30, 105, 90, 25, 25, 50, "Water", None, "Water3", None],
+    ["Kingler", 55, 130, 115, 50, 50, 75, "Water", None, "Water3", None],
+    ["Voltorb", 40, 30, 50, 55, 55, 100, "Electric", None, "Mineral", None],
+    ["Electrode", 60, 50, 70, 80, 80, 150, "Electric", None, "Mineral", None],
+    ["Exeggcute", 60, 40, 80, 60, 45, 40, "Grass", "Psychic", "Grass", None],
+    ["Exeggutor", 95, 95, 85, 125, 75, 55, "Grass", "Psychic", "Grass", None],
+    ["Cubone", 50, 50, 95, 40, 50, 35, "Ground", None, "Monster", None],
+    ["Marowak", 60, 80, 110, 50, 80, 45, "Ground", None, "Monster", None],
+    ["Hitmonlee", 50, 120, 53, 35, 110, 87, "Fighting", None, "Human-Like", None],
+    ["Hitmonchan", 50, 105, 79, 35, 110, 76, "Fighting", None, "Human-Like", None],
+    ["Lickitung", 90, 55, 75, 60, 75, 30, "Normal", None, "Monster", None],
+    ["Koffing", 40, 65, 95, 60, 45, 35, "Poison", None, "Amorphous", None],
+    ["Weezing", 65, 90, 120, 85, 70, 60, "Poison", None, "Amorphous", None],
+    ["Rhyhorn", 80, 85, 95, 30, 30, 25, "Ground", "Rock", "Monster", "Field"],
+    ["Rhydon", 105, 130, 120, 45, 45, 40, "Ground", "Rock", "Monster", "Field"],
+    ["Chansey", 250, 5, 5, 35, 105, 50, "Normal", None, "Fairy", None],
+    ["Tangela", 65, 55, 115, 100, 40, 60, "Grass", None, "Grass", None],
+    ["Kangaskhan", 105, 95, 80, 40, 80, 90, "Normal", None, "Monster", None],
+    ["Horsea", 30, 40, 70, 70, 25, 60, "Water", None, "Water1", "Dragon"],
+    ["Seadra", 55, 65, 95, 95, 45, 85, "Water", None, "Water1", "Dragon"],
+    ["Goldeen", 45, 67, 60, 35, 50, 63, "Water", None, "Water2", None],
+    ["Seaking", 80, 92, 65, 65, 80, 68, "Water", None, "Water2", None],
+    ["Staryu", 30, 45, 55, 70, 55, 85, "Water", None, "Water3", None],
+    ["Starmie", 60, 75, 85, 100, 85, 115, "Water", "Psychic", "Water3", None],
+    ["MrMime", 40, 45, 65, 100, 120, 90, "Psychic", "Fairy", "Human-Like", None],
+    ["Scyther", 70, 110, 80, 55, 80, 105, "Bug", "Flying", "Bug", None],
+    ["Jynx", 65, 50, 35, 115, 95, 95, "Ice", "Psychic", "Human-Like", None],
+    ["Electabuzz", 65, 83, 57, 95, 85, 105, "Electric", None, "Human-Like", None],
+    ["Magmar", 65, 95, 57, 100, 85, 93, "Fire", None, "Human-Like", None],
+    ["Pinsir", 65, 125, 100, 55, 70, 85, "Bug", None, "Bug", None],
+    ["Tauros", 75, 100, 95, 40, 70, 110, "Normal", None, "Field", None],
+    ["Magikarp", 20, 10, 55, 15, 20, 80, "Water", None, "Water2", "Dragon"],
+    ["Gyarados", 95, 125, 79, 60, 100, 81, "Water", "Flying", "Water2", "Dragon"],
+    ["Lapras", 130, 85, 80, 85, 95, 60, "Water", "Ice", "Monster", "Water1"],
+    ["Ditto", 48, 48, 48, 48, 48, 48, "Normal", None, "Ditto", None],
+    ["Eevee", 55, 55, 50, 45, 65, 55, "Normal", None, "Field", None],
+    ["Vaporeon", 130, 65, 60, 110, 95, 65, "Water", None, "Field", None],
+    ["Jolteon", 65, 65, 60, 110, 95, 130, "Electric", None, "Field", None],
+    ["Flareon", 65, 130, 60, 95, 110, 65, "Fire", None, "Field", None],
+    ["Porygon", 65, 60, 70, 85, 75, 40, "Normal", None, "Mineral", None],
+    ["Omanyte", 35, 40, 100, 90, 55, 35, "Rock", "Water", "Water1", "Water3"],
+    ["Omastar", 70, 60, 125, 115, 70, 55, "Rock", "Water", "Water1", "Water3"],
+    ["Kabuto", 30, 80, 90, 55, 45, 55, "Rock", "Water", "Water1", "Water3"],
+    ["Kabutops", 60, 115, 105, 65, 70, 80, "Rock", "Water", "Water1", "Water3"],
+    ["Aerodactyl", 80, 105, 65, 60, 75, 130, "Rock", "Flying", "Flying", None],
+    ["Snorlax", 160, 110, 65, 65, 110, 30, "Normal", None, "Monster", None],
+    ["Articuno", 90, 85, 100, 95, 125, 85, "Ice", "Flying", "Undiscovered", None],
+    ["Zapdos", 90, 90, 85, 125, 90, 100, "Electric", "Flying", "Undiscovered", None],
+    ["Moltres", 90, 100, 90, 125, 85, 90, "Fire", "Flying", "Undiscovered", None],
+    ["Dratini", 41, 64, 45, 50, 50, 50, "Dragon", None, "Water1", "Dragon"],
+    ["Dragonair", 61, 84, 65, 70, 70, 70, "Dragon", None, "Water1", "Dragon"],
+    ["Dragonite", 91, 134, 95, 100, 100, 80, "Dragon", "Flying", "Water1", "Dragon"],
+    ["Mewtwo", 106, 110, 90, 154, 90, 130, "Psychic", None, "Undiscovered", None],
+    ["Mew", 100, 100, 100, 100, 100, 100, "Psychic", None, "Undiscovered", None]
+]
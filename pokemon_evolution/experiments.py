@@ -0,0 +1,157 @@
+"""Parallel replicates and parameter sweeps"""
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import core
+from .core import SEED, DEFAULT_PARAMS, run_simulation
+
+# Replicates
+def _padded(series, length):
+    """Extend a (generation, species) series to length rows of NaN after an early stop"""
+    if len(series) == length:
+        return series
+    padded = np.full((length, series.shape[1]), np.nan)
+    padded[:len(series)] = series
+    return padded
+
+def _replicate_worker(task):
+    replicate, seed, generations, config = task
+    results = run_simulation(config, generations=generations, seed=seed)
+    if generations is None:
+        generations = (config or {}).get("GENERATIONS", core.GENERATIONS)
+    sids = core.prototypes['species_id'].values
+    return replicate, {
+        "gen_logs": results['gen_logs'],
+        "species_counts": _padded(results['species_count_series'][:, sids], generations),
+        "species_biomass": _padded(results['species_time_series'][:, sids], generations),
+        "extinction_events": results['extinction_events'],
+        "stopped": results['stopped'] or {"generation": len(results['gen_logs']), "reason": ""}
+    }
+
+def run_replicates(n_replicates, seed=SEED, generations=None, processes=None, config=None):
+    """Run independent trajectories of one configuration across a process pool and merge them.
+
+    config maps parameter names (SIM_PARAMS) to values for every replicate.
+    Each replicate is seeded from its own child of SeedSequence(seed), so the
+    merged dataset does not depend on the pool size or on scheduling. Species
+    arrays are (replicate, generation, species) in prototype order; a
+    replicate that stops early (STOP_WINDOW) is padded with NaN, and
+    "stopped" gives each replicate's last generation and stop reason.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(n_replicates)
+    tasks = [(r, child, generations, config) for r, child in enumerate(seeds)]
+    with multiprocessing.Pool(processes) as pool:
+        outputs = dict(pool.imap_unordered(_replicate_worker, tasks))
+    runs = [outputs[r] for r in range(n_replicates)]
+    gen_logs = pd.DataFrame([dict(replicate=r, **log) for r, run in enumerate(runs)
+                             for log in run['gen_logs']])
+    extinctions = pd.DataFrame(
+        [(r, sid, gen) for r, run in enumerate(runs) for sid, gen in run['extinction_events'].items()],
+        columns=["replicate", "species_id", "gen"])
+    stopped = pd.DataFrame([dict(replicate=r, **run['stopped']) for r, run in enumerate(runs)],
+                           columns=["replicate", "generation", "reason"])
+    return {
+        "species_ids": core.prototypes['species_id'].to_numpy(),
+        "gen_logs": gen_logs,
+        "species_counts": np.stack([run['species_counts'] for run in runs]),
+        "species_biomass": np.stack([run['species_biomass'] for run in runs]),
+        "extinctions": extinctions,
+        "stopped": stopped
+    }
+
+def save_replicates(data, out_dir):
+    """Write a merged replicate dataset as CSV tables plus .npy species arrays"""
+    os.makedirs(out_dir, exist_ok=True)
+    data['gen_logs'].to_csv(os.path.join(out_dir, "gen_logs.csv"), index=False)
+    data['extinctions'].to_csv(os.path.join(out_dir, "extinctions.csv"), index=False)
+    data['stopped'].to_csv(os.path.join(out_dir, "stopped.csv"), index=False)
+    for name in ("species_ids", "species_counts", "species_biomass"):
+        np.save(os.path.join(out_dir, f"{name}.npy"), data[name])
+
+# Parameter sweeps
+def grid_design(space):
+    """Full factorial design: {name: [values]} -> list of parameter dicts"""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*space.values())]
+
+def latin_hypercube(space, n_points, seed=SEED):
+    """Latin-hypercube design: {name: (low, high)} -> n_points parameter dicts"""
+    lhs_rng = np.random.default_rng(seed)
+    points = [{} for _ in range(n_points)]
+    for name, (low, high) in space.items():
+        u = (lhs_rng.permutation(n_points) + lhs_rng.random(n_points)) / n_points
+        values = low + u * (high - low)
+        if isinstance(DEFAULT_PARAMS[name], int):
+            values = np.round(values).astype(int)
+        for point, value in zip(points, values.tolist()):
+            point[name] = value
+    return points
+
+def load_design(path):
+    """Read a JSON sweep design.
+
+    {"grid": {name: [values]}} or {"lhs": {name: [low, high]}, "points": n},
+    plus optional "fixed": {name: value}, "replicates" and "seed".
+    """
+    with open(path) as f:
+        spec = json.load(f)
+    if "grid" in spec:
+        points = grid_design(spec["grid"])
+    else:
+        points = latin_hypercube(spec["lhs"], spec["points"], spec.get("seed", SEED))
+    fixed = spec.get("fixed", {})
+    points = [dict(fixed, **point) for point in points]
+    return points, spec.get("replicates", 1), spec.get("seed", SEED)
+
+def point_key(params, replicates, seed):
+    """Stable file name for a design point, used to skip finished points"""
+    blob = json.dumps({"params": params, "replicates": replicates, "seed": seed}, sort_keys=True)
+    return "point-" + hashlib.sha1(blob.encode()).hexdigest()[:12]
+
+def summarize_run(results):
+    """Tidy per-generation summary: population, richness and diet totals"""
+    return pd.DataFrame(results['gen_logs'])
+
+def _sweep_worker(task):
+    params, replicates, seed, path = task
+    tables = []
+    for r, child in enumerate(np.random.SeedSequence(seed).spawn(replicates)):
+        results = run_simulation(params, seed=child)
+        stopped = results['stopped'] or {}
+        tables.append(summarize_run(results).assign(replicate=r, stop_reason=stopped.get('reason', "")))
+    table = pd.concat(tables, ignore_index=True)
+    for i, (name, value) in enumerate(params.items()):
+        table.insert(i, name, value)
+    # Write-then-rename so an interrupted point is never mistaken for a finished one
+    table.to_csv(path + ".tmp", index=False)
+    os.replace(path + ".tmp", path)
+    return path
+
+def run_sweep(points, out_dir, replicates=1, seed=SEED, processes=None, verbose=False):
+    """Run every design point headless across a process pool; returns all summaries.
+
+    Each point is written to out_dir/<point key>.csv and skipped on later
+    calls if that file exists, so an interrupted sweep resumes where it
+    stopped. Workers are forked from this process, so the prototype, species
+    and type-advantage tables are shared with them rather than rebuilt per run.
+    All points use the same replicate seeds (common random numbers).
+    verbose prints progress as points finish.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    paths = [os.path.join(out_dir, point_key(params, replicates, seed) + ".csv") for params in points]
+    tasks = [(params, replicates, seed, path)
+             for params, path in zip(points, paths) if not os.path.exists(path)]
+    if verbose:
+        print(f"Sweep: {len(points) - len(tasks)} of {len(points)} points already done")
+    if tasks:
+        with multiprocessing.Pool(processes) as pool:
+            for done, path in enumerate(pool.imap_unordered(_sweep_worker, tasks), 1):
+                if verbose:
+                    print(f"  [{done}/{len(tasks)}] {path}")
+    return pd.concat([pd.read_csv(path) for path in paths], ignore_index=True)
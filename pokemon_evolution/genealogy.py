@@ -0,0 +1,108 @@
+"""Queries over the genealogy store (core.Genealogy): ancestry, lineages and cross-species births.
+
+Rows are appended in uid order and parents are always born before their
+children, so every lookup is a binary search or a forward pass over the
+columns; the store can be memory-mapped (Genealogy.load(dir, mmap_mode='r')).
+"""
+import numpy as np
+import pandas as pd
+
+from . import core
+
+def rows_of(genealogy, ids):
+    """Row of each uid in the store, -1 for unknown ids (e.g. -1 parents)"""
+    ids = np.asarray(ids, dtype=np.int64)
+    child_id = genealogy.child_id
+    if len(child_id) == 0:
+        return np.full(ids.shape, -1)
+    rows = np.minimum(np.searchsorted(child_id, ids), len(child_id) - 1)
+    found = child_id[rows] == ids
+    return np.where(found, rows, -1)
+
+def parent_rows(genealogy):
+    """(n, 2) rows of every entry's parents, -1 for founders"""
+    return np.column_stack([rows_of(genealogy, genealogy.parent1_id),
+                            rows_of(genealogy, genealogy.parent2_id)])
+
+def ancestors(genealogy, ids, max_depth=None):
+    """Sorted uids of every ancestor of ids (up to max_depth generations back)"""
+    parents = parent_rows(genealogy)
+    seen = np.zeros(len(genealogy), dtype=bool)
+    frontier = rows_of(genealogy, ids)
+    depth = 0
+    while True:
+        frontier = np.unique(parents[frontier[frontier >= 0]])
+        frontier = frontier[frontier >= 0]
+        frontier = frontier[~seen[frontier]]
+        depth += 1
+        if len(frontier) == 0 or (max_depth is not None and depth > max_depth):
+            break
+        seen[frontier] = True
+    return genealogy.child_id[seen]
+
+def descendant_mask(genealogy, ids):
+    """Boolean mask over rows: entries descended (through either parent) from ids"""
+    parents = parent_rows(genealogy)
+    born = genealogy.generation_born
+    mask = np.zeros(len(genealogy), dtype=bool)
+    roots = rows_of(genealogy, ids)
+    mask[roots[roots >= 0]] = True
+    marked = np.append(mask, False)  # index -1 (no parent) reads False
+    # Rows are grouped by birth generation and parents are born in an
+    # earlier one (founders aside), so one vectorized step per generation
+    bounds = np.r_[0, np.flatnonzero(born[1:] != born[:-1]) + 1, len(born)]
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        block = parents[start:stop]
+        marked[start:stop] |= marked[block[:, 0]] | marked[block[:, 1]]
+    return marked[:-1] & ~mask
+
+def descendants(genealogy, ids):
+    """Sorted uids of every descendant of ids"""
+    return genealogy.child_id[descendant_mask(genealogy, ids)]
+
+def lineage_roots(genealogy):
+    """Founder row of every entry, following first parents back (pointer jumping)"""
+    root = rows_of(genealogy, genealogy.parent1_id)
+    own = np.arange(len(genealogy))
+    root = np.where(root >= 0, root, own)
+    while True:
+        jumped = root[root]
+        if np.array_equal(jumped, root):
+            return root
+        root = jumped
+
+def lineage_survival(genealogy, living_ids):
+    """Founders (first-parent lineages) ranked by how many of living_ids descend from them.
+
+    Both counts exclude the founder itself.
+    """
+    roots = lineage_roots(genealogy)
+    rows = rows_of(genealogy, living_ids)
+    rows = rows[rows >= 0]
+    rows = rows[roots[rows] != rows]  # founders are not their own descendants
+    surviving = np.bincount(roots[rows], minlength=len(genealogy))
+    founders = np.flatnonzero(genealogy.parent1_id < 0)
+    table = pd.DataFrame({
+        "founder_id": genealogy.child_id[founders],
+        "species_id": genealogy.species_id[founders],
+        "descendants_born": np.bincount(roots, minlength=len(genealogy))[founders] - 1,
+        "living_descendants": surviving[founders],
+    })
+    return table.sort_values("living_descendants", ascending=False, ignore_index=True)
+
+def cross_species_births(genealogy, species=None):
+    """Births where a parent is one of species (default Ditto and Mew) or the parents' species differ"""
+    parents = parent_rows(genealogy)
+    bred = np.flatnonzero(parents[:, 0] >= 0)
+    s1 = genealogy.species_id[parents[bred, 0]]
+    s2 = genealogy.species_id[parents[bred, 1]]
+    species = (core.DITTO_ID, core.MEW_ID) if species is None else species
+    hit = np.isin(s1, species) | np.isin(s2, species) | (s1 != s2)
+    rows = bred[hit]
+    return pd.DataFrame({
+        "child_id": genealogy.child_id[rows],
+        "generation_born": genealogy.generation_born[rows],
+        "child_species": genealogy.species_id[rows],
+        "parent1_species": s1[hit],
+        "parent2_species": s2[hit],
+    })
@@ -0,0 +1,204 @@
+"""Domain decomposition: one trajectory split across worker processes.
+
+On a habitat grid (GRID_SIZE > 0) each shard owns a band of grid rows and
+individuals that walk off their band are handed to the owning shard. In a
+well-mixed world the shards are islands that share the plant budget and
+swap a fraction of their members round a ring every few generations.
+The coordinator splits K_TOTAL across shards and merges their species
+aggregates, so the run is logged like run_simulation's.
+"""
+import multiprocessing
+
+import numpy as np
+
+from . import core
+from .core import SEED, apply_params, make_rngs
+from .convergence import stop_reason
+
+UID_BLOCK = 1 << 40  # uids born in shard k start at (k + 1) * UID_BLOCK
+
+def shard_of(cells, n_shards):
+    """Owning shard of each grid cell (bands of whole grid rows)"""
+    return (np.asarray(cells) // core.GRID_SIZE) * n_shards // core.GRID_SIZE
+
+def _select(columns, idx):
+    return {name: values[idx] for name, values in columns.items()}
+
+def _capacity_shares(alive, capacity):
+    """Split capacity across shards in proportion to their living (largest remainder)"""
+    alive = np.asarray(alive, dtype=np.int64)
+    if alive.sum() <= capacity:
+        return alive
+    share = capacity * alive / alive.sum()
+    quota = np.floor(share).astype(np.int64)
+    quota[np.argsort(quota - share)[:capacity - quota.sum()]] += 1
+    return quota
+
+def merge_aggregates(aggs):
+    """Combine per-shard aggregate_species results into whole-world totals"""
+    n_ids = max(len(agg['count']) for agg in aggs)
+    def padded(agg, key):
+        values = agg[key]
+        pad = [(0, n_ids - len(values))] + [(0, 0)] * (values.ndim - 1)
+        return np.pad(values, pad)
+    merged = {key: sum(padded(agg, key) for agg in aggs)
+              for key in aggs[0] if key not in ("mean_level", "max_level")}
+    merged['max_level'] = np.max([padded(agg, 'max_level') for agg in aggs], axis=0)
+    level_sums = sum(padded(agg, 'mean_level') * padded(agg, 'count') for agg in aggs)
+    merged['mean_level'] = level_sums / np.maximum(merged['count'], 1)
+    return merged
+
+def _shard_worker(conn, shard, n_shards, seed, config, columns):
+    """Command loop of one shard; the coordinator drives it generation by generation"""
+    apply_params(config)
+    if not core.GRID_SIZE:
+        # Islands split the plant budget
+        apply_params({"P_TOTAL": core.P_TOTAL / n_shards})
+    rngs = make_rngs(seed)
+    pop = core.population_class()()
+    pop.append(columns)
+    # Disjoint uid ranges per shard for the newborns
+    pop.next_uid = (shard + 1) * UID_BLOCK
+    while True:
+        command, *args = conn.recv()
+        if command == "move":
+            gen_num, = args
+            pop.generation = gen_num
+            core.move_phase(pop, rngs['movement'])
+            alive = pop.alive_indices()
+            owner = shard_of(pop.cell[alive], n_shards)
+            leaving = alive[owner != shard]
+            emigrants = pop.extract(leaving)
+            conn.send([(dest, _select(emigrants, np.flatnonzero(owner[owner != shard] == dest)))
+                       for dest in np.unique(owner[owner != shard]).tolist()])
+        elif command == "phases":
+            gen_num, immigrants = args
+            pop.generation = gen_num
+            for batch in immigrants:
+                pop.append(batch)
+            events = core.interaction_phases(pop, gen_num, rngs)
+            conn.send((pop.count_alive(), events))
+        elif command == "close":
+            gen_num, capacity, n_migrants = args
+            agg = core.close_generation(pop, gen_num, rngs, capacity=capacity)
+            migrants = None
+            if n_migrants:
+                alive = pop.alive_indices()
+                chosen = rngs['movement'].choice(alive, size=min(n_migrants, len(alive)), replace=False)
+                migrants = pop.extract(np.sort(chosen))
+            conn.send((agg, migrants))
+        elif command == "stop":
+            conn.send(len(pop))
+            conn.close()
+            return
+
+def run_sharded(n_shards, generations=None, config=None, seed=SEED, migrate_every=1,
+                migration_rate=0.01, verbose=False):
+    """Run one trajectory across n_shards worker processes; returns its logs and species series.
+
+    The initial population is drawn once from seed and dealt out to the
+    shards (by grid band, or at random between islands); each shard then
+    draws from its own child of SeedSequence(seed). Shard borders clip
+    neighbourhoods (combat, mating) to the shard, K_TOTAL is enforced as
+    per-shard quotas proportional to the living, and neither the dead nor
+    the genealogy are kept.
+    """
+    config = dict(config or {}, ARCHIVE_DEAD=False, GENEALOGY=False)
+    previous = apply_params(config)
+    try:
+        if generations is None:
+            generations = core.GENERATIONS
+        if core.GRID_SIZE and core.GRID_SIZE < n_shards:
+            raise ValueError(f"GRID_SIZE {core.GRID_SIZE} has fewer rows than {n_shards} shards")
+        root, *children = np.random.SeedSequence(seed).spawn(n_shards + 1)
+        setup = make_rngs(root)['setup']
+        pop = core.initial_population(setup)
+        columns = pop.extract(np.arange(len(pop)))
+        if core.GRID_SIZE:
+            owner = shard_of(columns['cell'], n_shards)
+        else:
+            owner = setup.integers(n_shards, size=len(columns['cell']))
+        conns, workers = [], []
+        for shard, child in enumerate(children):
+            parent_conn, child_conn = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=_shard_worker,
+                args=(child_conn, shard, n_shards, child, config,
+                      _select(columns, np.flatnonzero(owner == shard))),
+                daemon=True)
+            worker.start()
+            child_conn.close()
+            conns.append(parent_conn)
+            workers.append(worker)
+        try:
+            return _coordinate(conns, generations, migrate_every, migration_rate, verbose)
+        finally:
+            for conn in conns:
+                conn.send(("stop",))
+                conn.recv()
+            for worker in workers:
+                worker.join()
+    finally:
+        apply_params(previous)
+
+def _coordinate(conns, generations, migrate_every, migration_rate, verbose):
+    n_shards = len(conns)
+    gen_logs = []
+    series = core.species_series(generations)
+    species_time_series = series['species_time_series']
+    species_count_series = series['species_count_series']
+    extinction_events = {}
+    stopped = None
+    inbox = [[] for _ in conns]
+    for g in range(generations):
+        # Boundary crossings on the grid
+        if core.GRID_SIZE:
+            for conn in conns:
+                conn.send(("move", g))
+            for conn in conns:
+                for dest, batch in conn.recv():
+                    inbox[dest].append(batch)
+        for conn, immigrants in zip(conns, inbox):
+            conn.send(("phases", g, immigrants))
+        alive = [conn.recv()[0] for conn in conns]
+        inbox = [[] for _ in conns]
+
+        # Island migration round the ring
+        migrate = not core.GRID_SIZE and n_shards > 1 and (g + 1) % migrate_every == 0
+        capacities = _capacity_shares(alive, core.K_TOTAL)
+        for conn, capacity in zip(conns, capacities.tolist()):
+            n_migrants = int(round(migration_rate * capacity)) if migrate else 0
+            conn.send(("close", g, capacity, n_migrants))
+        aggs = []
+        for shard, conn in enumerate(conns):
+            agg, migrants = conn.recv()
+            aggs.append(agg)
+            if migrants is not None:
+                inbox[(shard + 1) % n_shards].append(migrants)
+        agg = merge_aggregates(aggs)
+
+        counts = agg['count'][:core.N_SPECIES_IDS]
+        for sid in np.flatnonzero(core.species_table.valid & (counts == 0)).tolist():
+            extinction_events.setdefault(sid, g)
+        gen_logs.append(core.generation_log(g, counts))
+        total_pop = gen_logs[-1]['total_pop']
+        species_richness = gen_logs[-1]['species_richness']
+        species_time_series[g] = agg['total_biomass'][:core.N_SPECIES_IDS]
+        species_count_series[g] = counts
+
+        if verbose and ((g + 1) % 20 == 0 or g == 0):
+            print(f"Gen {g+1}/{generations} - Pop: {total_pop}, Species: {species_richness}, "
+                  f"Shards: {alive}")
+        reason = None
+        if core.STOP_WINDOW:
+            reason = stop_reason(gen_logs, core.STOP_WINDOW, core.STOP_CV, core.STOP_TREND)
+        if reason is not None:
+            stopped = {"generation": g + 1, "reason": reason}
+            break
+    return {
+        "gen_logs": gen_logs,
+        "species_time_series": species_time_series[:len(gen_logs)],
+        "species_count_series": species_count_series[:len(gen_logs)],
+        "extinction_events": extinction_events,
+        "stopped": stopped,
+    }
@@ -0,0 +1,278 @@
+"""Final analysis, figures and summary of a single run"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import core
+from .core import aggregate_species, HERBIVORE, CARNIVORE, PARASITE
+from .analysis import diet_totals, top_species
+
+def _finish(plt, name, figures_dir, show):
+    """Save the current figure to figures_dir (if given), show it (if asked) and close it"""
+    if figures_dir is not None:
+        plt.savefig(os.path.join(figures_dir, f"{name}.png"), dpi=120, bbox_inches='tight')
+    if show:
+        plt.show()
+    plt.close('all')
+
+def final_table(population):
+    """Per-species table of the living population, most numerous first"""
+    prototypes = core.prototypes
+    final_agg = aggregate_species(population)
+    present = np.flatnonzero(final_agg['count'])
+    proto_by_id = prototypes.set_index('species_id')
+    final_df = pd.DataFrame({
+        "species_id": present,
+        "name": proto_by_id.loc[present, 'name'].values,
+        "count": final_agg['count'][present],
+        "total_biomass": final_agg['total_biomass'][present],
+        "total_xp": final_agg['total_xp'][present],
+        "max_level": final_agg['max_level'][present],
+        "diet": proto_by_id.loc[present, 'diet'].values,
+        "egg_group": proto_by_id.loc[present, 'egg_group1'].values
+    })
+    return final_df.sort_values("count", ascending=False).reset_index(drop=True)
+
+def report(results, figures_dir="figures", show=False):
+    """Final analysis, figures and summary of a single run
+
+    Figures are saved as PNGs under figures_dir and only shown interactively
+    with show=True; with neither, matplotlib and scikit-learn are never imported.
+    """
+    final_df = final_table(results['population'])
+    if figures_dir is not None or show:
+        plot_report(results, final_df, figures_dir, show)
+    print_summary(results, final_df)
+
+def plot_report(results, final_df, figures_dir=None, show=False):
+    """The seven report figures: rankings, richness, dynamics, extinctions, predator-prey and PCA"""
+    import matplotlib
+    if not show:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    if figures_dir is not None:
+        os.makedirs(figures_dir, exist_ok=True)
+    names = core.species_table.name
+    population = results['population']
+    gen_logs = results['gen_logs']
+    species_count_series = results['species_count_series']
+    extinction_events = results['extinction_events']
+
+    # === VISUALIZATIONS ===
+
+    # 1. Top 20 Species by Population
+    plt.figure(figsize=(14, 6))
+    top20 = final_df.head(20)
+    colors = ['green' if d == 'herbivore' else 'red' if d == 'carnivore' else 'purple' 
+              for d in top20['diet']]
+    plt.bar(range(len(top20)), top20['count'], color=colors)
+    plt.xticks(range(len(top20)), top20['name'], rotation=45, ha='right')
+    plt.title("🏆 Top 20 Species by Population (Final Generation)", fontsize=14, fontweight='bold')
+    plt.ylabel("Population Count")
+    plt.xlabel("Species")
+    plt.legend(handles=[
+        plt.Rectangle((0,0),1,1, color='green', label='Herbivore'),
+        plt.Rectangle((0,0),1,1, color='red', label='Carnivore'),
+        plt.Rectangle((0,0),1,1, color='purple', label='Parasite')
+    ])
+    plt.tight_layout()
+    _finish(plt, "01_top_species", figures_dir, show)
+
+    # 2. Species Richness Over Time
+    gens = [log['gen'] for log in gen_logs]
+    richness = [log['species_richness'] for log in gen_logs]
+
+    plt.figure(figsize=(10, 5))
+    plt.plot(gens, richness, linewidth=2, color='blue')
+    plt.fill_between(gens, richness, alpha=0.3)
+    plt.title("📊 Species Richness Over Generations", fontsize=14, fontweight='bold')
+    plt.xlabel("Generation")
+    plt.ylabel("Number of Living Species")
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    _finish(plt, "02_species_richness", figures_dir, show)
+
+    # 3. Population Dynamics of Top 10 Final Species
+    plt.figure(figsize=(12, 6))
+    for sid in top_species(species_count_series, 10):
+        plt.plot(gens, species_count_series[:, sid], label=names[sid], linewidth=2)
+
+    plt.title("📈 Population Dynamics: Top 10 Final Species", fontsize=14, fontweight='bold')
+    plt.xlabel("Generation")
+    plt.ylabel("Population Count")
+    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    _finish(plt, "03_top_species_dynamics", figures_dir, show)
+    # 4. Extinction Timeline
+    plt.figure(figsize=(12, 6))
+    if extinction_events:
+        extinction_gens = np.sort(list(extinction_events.values()))
+        plt.scatter(extinction_gens, range(len(extinction_gens)), alpha=0.6, s=50)
+        plt.title("💀 Species Extinction Timeline", fontsize=14, fontweight='bold')
+        plt.xlabel("Generation")
+        plt.ylabel("Cumulative Extinctions")
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        _finish(plt, "04_extinction_timeline", figures_dir, show)
+    # 5. Game Theory: Predator-Prey Dynamics
+    totals = diet_totals(species_count_series)
+    herbivore_pops = totals[:, HERBIVORE]
+    carnivore_pops = totals[:, CARNIVORE]
+    parasite_pops = totals[:, PARASITE]
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    # Time series
+    ax1.plot(gens, herbivore_pops, label='Herbivores (Prey)', color='green', linewidth=2)
+    ax1.plot(gens, carnivore_pops, label='Carnivores (Predators)', color='red', linewidth=2)
+    ax1.plot(gens, parasite_pops, label='Parasites', color='purple', linewidth=2)
+    ax1.set_title("🎮 Game Theory: Predator-Prey-Parasite Dynamics", fontsize=14, fontweight='bold')
+    ax1.set_xlabel("Generation")
+    ax1.set_ylabel("Population Count")
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    # Phase space (Predator vs Prey)
+    ax2.plot(herbivore_pops, carnivore_pops, alpha=0.6, linewidth=1)
+    ax2.scatter(herbivore_pops[0], carnivore_pops[0], c='blue', s=100, label='Start', zorder=5)
+    ax2.scatter(herbivore_pops[-1], carnivore_pops[-1], c='red', s=100, label='End', zorder=5)
+    ax2.set_title("Phase Space: Carnivore vs Herbivore", fontsize=12, fontweight='bold')
+    ax2.set_xlabel("Herbivore Population")
+    ax2.set_ylabel("Carnivore Population")
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    plt.tight_layout()
+    _finish(plt, "05_predator_prey", figures_dir, show)
+    # 6. PCA Analysis
+    print("\n🔬 Running PCA Analysis...\n")
+    # Prepare data for PCA
+    pca_data = []
+    pca_labels = []
+    pca_colors = []
+
+    current_stats = population.current_stats
+    diets = population.diet
+    # Living rows grouped by species once, keeping row order within each species
+    living = np.flatnonzero(population.alive)
+    living = living[np.argsort(population.species_id[living], kind='stable')]
+    living_species = population.species_id[living]
+    for sid in final_df['species_id'].values:
+        start = np.searchsorted(living_species, sid)
+        members = living[start:np.searchsorted(living_species, sid, side='right')]
+        for ind in members[:5]:  # Sample up to 5 individuals per species
+            pca_data.append(current_stats[ind])
+            pca_labels.append(core.species_table.name[sid])
+            diet = diets[ind]
+            if diet == HERBIVORE:
+                pca_colors.append('green')
+            elif diet == CARNIVORE:
+                pca_colors.append('red')
+            else:
+                pca_colors.append('purple')
+
+    if len(pca_data) > 10:
+        from sklearn.decomposition import PCA
+        from sklearn.preprocessing import StandardScaler
+        pca_data = np.array(pca_data)
+        # Standardize
+        scaler = StandardScaler()
+        pca_data_scaled = scaler.fit_transform(pca_data)
+        # PCA
+        pca = PCA(n_components=2)
+        pca_result = pca.fit_transform(pca_data_scaled)
+        # Plot
+        plt.figure(figsize=(12, 8))
+        scatter = plt.scatter(pca_result[:, 0], pca_result[:, 1], 
+                             c=pca_colors, alpha=0.6, s=100, edgecolors='black', linewidth=0.5)
+    
+        plt.title("🧬 PCA: Pokémon Trait Space\n(HP, Atk, Def, SpA, SpD, Speed)", 
+                  fontsize=14, fontweight='bold')
+        plt.xlabel(f"PC1 ({pca.explained_variance_ratio_[0]*100:.1f}% variance)")
+        plt.ylabel(f"PC2 ({pca.explained_variance_ratio_[1]*100:.1f}% variance)")
+    
+        plt.legend(handles=[
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='green', 
+                       markersize=10, label='Herbivore'),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='red', 
+                       markersize=10, label='Carnivore'),
+            plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='purple', 
+                       markersize=10, label='Parasite')
+        ])
+    
+        plt.grid(True, alpha=0.3)
+        plt.tight_layout()
+        _finish(plt, "06_pca_traits", figures_dir, show)
+    
+        # PCA loadings
+        loadings = pca.components_.T * np.sqrt(pca.explained_variance_)
+        stat_names = ['HP', 'Atk', 'Def', 'SpA', 'SpD', 'Speed']
+        plt.figure(figsize=(10, 6))
+        for i, stat in enumerate(stat_names):
+            plt.arrow(0, 0, loadings[i, 0], loadings[i, 1], 
+                     head_width=0.1, head_length=0.1, fc='blue', ec='blue')
+            plt.text(loadings[i, 0]*1.15, loadings[i, 1]*1.15, stat, 
+                    fontsize=12, fontweight='bold')
+    
+        plt.title("PCA Loadings: Contribution of Each Stat", fontsize=14, fontweight='bold')
+        plt.xlabel("PC1")
+        plt.ylabel("PC2")
+        plt.axhline(0, color='black', linewidth=0.5)
+        plt.axvline(0, color='black', linewidth=0.5)
+        plt.grid(True, alpha=0.3)
+        plt.axis('equal')
+        plt.tight_layout()
+        _finish(plt, "07_pca_loadings", figures_dir, show)
+
+def print_summary(results, final_df):
+    """Console summary of the final generation"""
+    prototypes = core.prototypes
+    graveyard = results['graveyard']
+    extinction_events = results['extinction_events']
+
+    # === FINAL SUMMARY ===
+    print("\n" + "="*60)
+    print("📊 FINAL SIMULATION RESULTS")
+    print("="*60)
+
+    print(f"\n🌍 Total Living Population: {final_df['count'].sum()}")
+    print(f"🦋 Species Surviving: {len(final_df)} / {len(prototypes)}")
+    print(f"💀 Species Extinct: {len(extinction_events)}")
+    if graveyard is not None:
+        print(f"⚰️  Individuals archived: {len(graveyard)}")
+    if results.get('stopped'):
+        print(f"⏹️  Stopped early after generation {results['stopped']['generation']}: "
+              f"{results['stopped']['reason']}")
+
+    print("\n🏆 TOP 10 MOST DOMINANT SPECIES:")
+    print("-" * 60)
+    for i, row in final_df.head(10).iterrows():
+        print(f"{i+1:2d}. {row['name']:15s} | Pop: {row['count']:4d} | "
+              f"Diet: {row['diet']:10s} | Max Lvl: {row['max_level']:3.0f}")
+
+    print("\n🍃 DIET DISTRIBUTION (Final):")
+    diet_counts = final_df.groupby('diet')['count'].sum()
+    for diet, count in diet_counts.items():
+        pct = (count / final_df['count'].sum()) * 100
+        print(f"  {diet.capitalize():12s}: {count:4d} ({pct:5.1f}%)")
+
+    print("\n🥚 EGG GROUP DISTRIBUTION (Top 5):")
+    egg_counts = final_df.groupby('egg_group')['count'].sum().sort_values(ascending=False)
+    for egg_group, count in egg_counts.head(5).items():
+        pct = (count / final_df['count'].sum()) * 100
+        print(f"  {egg_group:15s}: {count:4d} ({pct:5.1f}%)")
+
+    # Special Pokémon status
+    special_pokemon = ['Mewtwo', 'Mew', 'Ditto', 'Dragonite', 'Charizard']
+    print("\n✨ SPECIAL POKÉMON STATUS:")
+    print("-" * 60)
+    for name in special_pokemon:
+        row = final_df[final_df['name'] == name]
+        if len(row) > 0:
+            r = row.iloc[0]
+            print(f"  {name:12s}: ✅ ALIVE | Pop: {r['count']:3d} | Level: {r['max_level']:3.0f}")
+        else:
+            gen = extinction_events.get(core.species_table.species_named(name), 'Unknown')
+            print(f"  {name:12s}: 💀 EXTINCT (Gen {gen})")
+
+    print("\n" + "="*60)
+    print("✅ Analysis Complete!")
+    print("="*60)
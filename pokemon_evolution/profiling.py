@@ -0,0 +1,74 @@
+"""Opt-in per-phase timings, event counters and cProfile capture for run_generation"""
+import cProfile
+import json
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+class PhaseProfiler:
+    """Collects one metrics record per generation.
+
+    Each record holds the generation, seconds spent in every phase (with
+    combat's ally and opponent search also reported on its own as
+    combat_matchmaking, a part of combat), the combat event counts, births and deaths by cause (combat, starvation from
+    upkeep, culling). Records are kept in `records` or, with path, streamed
+    as JSON lines. profile_gens (e.g. range(50, 60)) runs cProfile over those
+    generations and writes the stats to profile_path.
+    """
+    def __init__(self, path=None, profile_gens=(), profile_path="generations.prof"):
+        self.records = []
+        self._file = open(path, "w") if path else None
+        self.profile_gens = profile_gens
+        self.profile_path = profile_path
+        self._profile = None
+        self.record = None
+
+    def start_generation(self, gen):
+        self.record = {"gen": gen, "seconds": {}, "alive_change": {}}
+        if gen in self.profile_gens:
+            if self._profile is None:
+                self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name, pop=None):
+        alive = pop.count_alive() if pop is not None else 0
+        start = time.perf_counter()
+        yield
+        self.record["seconds"][name] = time.perf_counter() - start
+        if pop is not None:
+            self.record["alive_change"][name] = pop.count_alive() - alive
+
+    def end_generation(self, events):
+        if self._profile is not None and self.record["gen"] in self.profile_gens:
+            self._profile.disable()
+        record = self.record
+        change = record.pop("alive_change")
+        record["seconds"]["total"] = time.perf_counter() - self._start
+        record.update(events)
+        record["births"] = change["reproduction"]
+        record["deaths_combat"] = -change["combat"]
+        record["deaths_starvation"] = -change["upkeep"]
+        record["deaths_culling"] = -change["carrying_capacity"]
+        if self._file is not None:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+        else:
+            self.records.append(record)
+        self.record = None
+
+    def close(self):
+        if self._profile is not None:
+            self._profile.dump_stats(self.profile_path)
+            self._profile = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def read_metrics(path):
+    """Load a JSON-lines metrics stream as a flat DataFrame (phase times as seconds_<phase>)"""
+    with open(path) as f:
+        records = [json.loads(line) for line in f]
+    return pd.json_normalize(records, sep="_")
@@ -0,0 +1,59 @@
+"""2-D habitat grid: torus neighbourhoods, local movement and cell-list indexes"""
+import numpy as np
+
+# Moore neighbourhood offsets (dy, dx), own cell first
+OFFSETS = np.array([(0, 0), (-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)])
+
+def neighbour_table(size):
+    """(cells, 9) ids of every cell's 3x3 neighbourhood on a size x size torus, own cell first.
+
+    size 0 is the well-mixed world: a single cell that is its own only neighbour.
+    """
+    if size == 0:
+        return np.zeros((1, 1), dtype=np.int64)
+    y, x = np.divmod(np.arange(size * size), size)
+    ny = (y[:, None] + OFFSETS[:, 0]) % size
+    nx = (x[:, None] + OFFSETS[:, 1]) % size
+    return ny * size + nx
+
+def move(cells, size, prob, rng):
+    """New cells after each individual steps to a random adjacent cell with probability prob"""
+    cells = cells.copy()
+    movers = np.flatnonzero(rng.random(len(cells)) < prob)
+    dy, dx = OFFSETS[rng.integers(1, len(OFFSETS), size=len(movers))].T
+    y, x = np.divmod(cells[movers], size)
+    cells[movers] = ((y + dy) % size) * size + (x + dx) % size
+    return cells
+
+class CellIndex:
+    """Cell list: members bucketed by integer key (a cell, or diet x cell).
+
+    Built with one counting pass and a stable sort of 16-bit keys (a radix
+    sort), so rebuilding it every generation stays linear in the population.
+    """
+    def __init__(self, members, keys, n_keys):
+        members = np.asarray(members, dtype=np.int64)
+        keys = np.asarray(keys, dtype=np.int64)
+        sort_keys = keys.astype(np.uint16) if n_keys <= np.iinfo(np.uint16).max else keys
+        self.members = members[np.argsort(sort_keys, kind='stable')]
+        self.counts = np.bincount(keys, minlength=n_keys)
+        self.start = np.concatenate([[0], np.cumsum(self.counts)[:-1]])
+
+    def sample(self, key_sets, rng):
+        """One uniform member of the union of each row's buckets, -1 where they are all empty.
+
+        key_sets is (m, b): b bucket keys per draw, e.g. a 3x3 neighbourhood.
+        """
+        key_sets = np.asarray(key_sets, dtype=np.int64)
+        counts = self.counts[key_sets]
+        cum = np.cumsum(counts, axis=1)
+        total = cum[:, -1]
+        u = (rng.random(len(key_sets)) * total).astype(np.int64)
+        col = np.minimum((cum <= u[:, None]).sum(axis=1), key_sets.shape[1] - 1)
+        rows = np.arange(len(key_sets))
+        chosen = key_sets[rows, col]
+        offset = u - (cum[rows, col] - counts[rows, col])
+        found = total > 0
+        out = np.full(len(key_sets), -1, dtype=np.int64)
+        out[found] = self.members[self.start[chosen[found]] + offset[found]]
+        return out
@@ -0,0 +1,160 @@
+"""Streaming per-generation species telemetry"""
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from . import core
+
+# Telemetry
+TELEMETRY_FIELDS = ('count', 'total_biomass', 'total_xp', 'mean_level', 'max_level', 'culled')
+TELEMETRY_CHUNK = 64  # generations buffered in memory before a row group is written
+
+class TelemetryWriter:
+    """Stream per-generation species aggregates to disk in fixed-size row groups.
+
+    Formats: 'npy' writes one (generations, species) .npy per field that the
+    reader memory-maps, 'csv' appends wide CSV chunks and 'arrow' writes an
+    Arrow IPC file per field (requires pyarrow). meta.json records how many
+    generations are on disk, so a crashed run stays readable up to its last flush.
+    start > 0 reopens an existing stream (a resumed run), keeping its first
+    start generations and discarding any written after them.
+    """
+    def __init__(self, out_dir, generations, fmt='npy', chunk=TELEMETRY_CHUNK, start=0):
+        if fmt not in ('npy', 'csv', 'arrow'):
+            raise ValueError(f"Unknown telemetry format: {fmt}")
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.fmt = fmt
+        self.species_ids = core.prototypes['species_id'].to_numpy()
+        self.buffers = {f: np.zeros((chunk, len(self.species_ids))) for f in TELEMETRY_FIELDS}
+        self.gens = np.zeros(chunk, dtype=np.int64)
+        self.logs = []
+        self.pending = 0
+        self.rows = start
+        self.files = {}
+        if start:
+            with open(os.path.join(out_dir, "meta.json")) as f:
+                meta = json.load(f)
+            if meta['format'] != fmt or meta['rows'] < start:
+                raise ValueError(f"{out_dir} holds {meta['rows']} {meta['format']} generations, "
+                                 f"cannot resume {fmt} telemetry at generation {start}")
+        logs_path = os.path.join(out_dir, "gen_logs.csv")
+        if start:
+            pd.read_csv(logs_path).iloc[:start].to_csv(logs_path, index=False)
+        elif os.path.exists(logs_path):
+            os.remove(logs_path)
+        if fmt == 'npy':
+            for f in TELEMETRY_FIELDS:
+                kept = np.load(self._path(f))[:start] if start else None
+                self.files[f] = np.lib.format.open_memmap(
+                    self._path(f), mode='w+', dtype=np.float64,
+                    shape=(max(generations, start), len(self.species_ids)))
+                if start:
+                    self.files[f][:start] = kept
+        elif fmt == 'csv':
+            for f in TELEMETRY_FIELDS:
+                if start:
+                    kept = pd.read_csv(self._path(f), float_precision='round_trip').iloc[:start]
+                    kept.to_csv(self._path(f), index=False)
+                elif os.path.exists(self._path(f)):
+                    os.remove(self._path(f))
+        else:
+            import pyarrow as pa
+            self.schema = pa.schema([('gen', pa.int64())] +
+                                    [(str(sid), pa.float64()) for sid in self.species_ids])
+            for f in TELEMETRY_FIELDS:
+                kept = pa.ipc.open_file(pa.OSFile(self._path(f))).read_all().slice(0, start) if start else None
+                self.files[f] = pa.ipc.new_file(self._path(f), self.schema)
+                if start:
+                    self.files[f].write_table(kept)
+        self._write_meta()
+
+    def _path(self, field):
+        return os.path.join(self.out_dir, f"{field}.{self.fmt}")
+
+    def _write_meta(self):
+        meta = {"format": self.fmt, "rows": self.rows, "fields": list(TELEMETRY_FIELDS),
+                "species_ids": self.species_ids.tolist()}
+        with open(os.path.join(self.out_dir, "meta.json.tmp"), "w") as f:
+            json.dump(meta, f)
+        os.replace(os.path.join(self.out_dir, "meta.json.tmp"), os.path.join(self.out_dir, "meta.json"))
+
+    def write(self, gen, agg, log):
+        """Buffer one generation; flushes a row group when the buffer is full"""
+        for f in TELEMETRY_FIELDS:
+            self.buffers[f][self.pending] = agg[f][self.species_ids]
+        self.gens[self.pending] = gen
+        self.logs.append(log)
+        self.pending += 1
+        if self.pending == len(self.gens):
+            self.flush()
+
+    def flush(self):
+        n = self.pending
+        if n == 0:
+            return
+        for f in TELEMETRY_FIELDS:
+            block = self.buffers[f][:n]
+            if self.fmt == 'npy':
+                self.files[f][self.rows:self.rows + n] = block
+                self.files[f].flush()
+            elif self.fmt == 'csv':
+                frame = pd.DataFrame(block, columns=self.species_ids)
+                frame.insert(0, 'gen', self.gens[:n])
+                frame.to_csv(self._path(f), mode='a', header=self.rows == 0, index=False)
+            else:
+                import pyarrow as pa
+                columns = [pa.array(self.gens[:n])] + [pa.array(col) for col in block.T]
+                self.files[f].write_batch(pa.record_batch(columns, schema=self.schema))
+        pd.DataFrame(self.logs).to_csv(os.path.join(self.out_dir, "gen_logs.csv"),
+                                       mode='a', header=self.rows == 0, index=False)
+        self.logs = []
+        self.rows += n
+        self.pending = 0
+        self._write_meta()
+
+    def close(self):
+        self.flush()
+        if self.fmt == 'arrow':
+            for writer in self.files.values():
+                writer.close()
+        self.files = {}
+
+def read_telemetry(out_dir):
+    """Load a telemetry directory as {field: (generations, species) array}.
+
+    'npy' fields are read-only memory maps; the result also carries
+    species_ids, gen_logs and extinction_events rebuilt from the counts.
+    """
+    with open(os.path.join(out_dir, "meta.json")) as f:
+        meta = json.load(f)
+    fmt, rows = meta['format'], meta['rows']
+    data = {}
+    for field in meta['fields']:
+        path = os.path.join(out_dir, f"{field}.{fmt}")
+        if fmt == 'npy':
+            data[field] = np.load(path, mmap_mode='r')[:rows]
+        elif fmt == 'csv':
+            data[field] = pd.read_csv(path, float_precision='round_trip').drop(columns='gen').to_numpy()[:rows]
+        else:
+            import pyarrow as pa
+            table = pa.ipc.open_file(pa.memory_map(path)).read_all().drop(['gen'])
+            data[field] = np.column_stack([col.to_numpy() for col in table.columns])[:rows]
+    species_ids = np.array(meta['species_ids'])
+    data['species_ids'] = species_ids
+    data['gen_logs'] = pd.read_csv(os.path.join(out_dir, "gen_logs.csv")).iloc[:rows].to_dict('records')
+    extinct = data['count'] == 0
+    data['extinction_events'] = {int(sid): int(extinct[:, i].argmax())
+                                 for i, sid in enumerate(species_ids) if extinct[:, i].any()}
+    return data
+
+def telemetry_results(out_dir):
+    """Rebuild the run_simulation result series from a telemetry directory"""
+    data = read_telemetry(out_dir)
+    sids = data['species_ids']
+    series = core.species_series(len(data['gen_logs']))
+    series['species_time_series'][:, sids] = data['total_biomass']
+    series['species_count_series'][:, sids] = data['count']
+    return dict(series, gen_logs=data['gen_logs'], extinction_events=data['extinction_events'])
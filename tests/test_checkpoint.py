@@ -0,0 +1,73 @@
+"""A resumed run must match the uninterrupted one exactly"""
+import numpy as np
+import pytest
+
+import pokemon_evolution as pe
+from pokemon_evolution.core import DEFAULT_PARAMS, SERIES_DTYPES, apply_params
+from pokemon_evolution.telemetry import TelemetryWriter, telemetry_results
+
+GENERATIONS = 8
+CONFIG = {"K_TOTAL": 800, "P_TOTAL": 8000.0}
+
+@pytest.fixture(autouse=True)
+def default_params():
+    # load_checkpoint reinstates a snapshot's parameters globally
+    yield
+    apply_params(DEFAULT_PARAMS)
+
+def assert_same_run(a, b):
+    for name in a['population'].COLUMNS:
+        np.testing.assert_array_equal(getattr(a['population'], name), getattr(b['population'], name))
+    for key in SERIES_DTYPES:
+        np.testing.assert_array_equal(a[key], b[key])
+    assert a['gen_logs'] == b['gen_logs']
+    assert a['extinction_events'] == b['extinction_events']
+
+@pytest.mark.parametrize("streams", ["shared", "phase"])
+def test_resume_matches_uninterrupted(tmp_path, streams):
+    config = dict(CONFIG, RNG_STREAMS=streams, GENEALOGY=True, ARCHIVE_DEAD=True)
+    full = pe.run_simulation(config, generations=GENERATIONS, seed=5,
+                             checkpoint_dir=str(tmp_path), checkpoint_every=4)
+    resumed = pe.run_simulation(generations=GENERATIONS, state=pe.load_checkpoint(str(tmp_path / "gen-000004")))
+    assert_same_run(full, resumed)
+    np.testing.assert_array_equal(full['genealogy'].child_id, resumed['genealogy'].child_id)
+    np.testing.assert_array_equal(full['graveyard'].uid, resumed['graveyard'].uid)
+
+def test_resume_mapped_genealogy(tmp_path):
+    full = pe.run_simulation(dict(CONFIG, GENEALOGY=True), generations=GENERATIONS, seed=5)
+    config = dict(CONFIG, GENEALOGY=str(tmp_path / "genealogy"))
+    pe.run_simulation(config, generations=GENERATIONS, seed=5, checkpoint_dir=str(tmp_path), checkpoint_every=4)
+    resumed = pe.run_simulation(generations=GENERATIONS, state=pe.load_checkpoint(str(tmp_path / "gen-000004")))
+    assert_same_run(full, resumed)
+    on_disk = pe.Genealogy.load(str(tmp_path / "genealogy"), mmap_mode='r')
+    for name in pe.Genealogy.COLUMNS:
+        np.testing.assert_array_equal(getattr(on_disk, name), getattr(full['genealogy'], name))
+
+def test_resume_copy_on_write_mapped(tmp_path):
+    full = pe.run_simulation(CONFIG, generations=GENERATIONS, seed=5,
+                             checkpoint_dir=str(tmp_path), checkpoint_every=4)
+    with pytest.raises(ValueError, match="read-only"):
+        pe.run_simulation(generations=GENERATIONS,
+                          state=pe.load_checkpoint(str(tmp_path / "gen-000004"), mmap_mode='r'))
+    state = pe.load_checkpoint(str(tmp_path / "gen-000004"), mmap_mode='c')
+    assert_same_run(full, pe.run_simulation(generations=GENERATIONS, state=state))
+
+@pytest.mark.parametrize("fmt", ["npy", "csv"])
+def test_resume_telemetry_run(tmp_path, fmt):
+    full = pe.run_simulation(CONFIG, generations=GENERATIONS, seed=5)
+    stream = str(tmp_path / "telemetry")
+    pe.run_simulation(CONFIG, generations=GENERATIONS, seed=5,
+                      telemetry=TelemetryWriter(stream, GENERATIONS, fmt),
+                      checkpoint_dir=str(tmp_path / "ck"), checkpoint_every=4)
+    checkpoint = str(tmp_path / "ck" / "gen-000004")
+
+    # Appending to the stream from the checkpoint
+    state = pe.load_checkpoint(checkpoint)
+    sink = TelemetryWriter(stream, GENERATIONS, fmt, start=state['generation'])
+    resumed = pe.run_simulation(generations=GENERATIONS, state=state, telemetry=sink)
+    resumed.update(telemetry_results(stream))
+    assert_same_run(full, resumed)
+
+    # In memory, with the series so far read back from the stream
+    resumed = pe.run_simulation(generations=GENERATIONS, state=pe.load_checkpoint(checkpoint))
+    assert_same_run(full, resumed)
@@ -0,0 +1,16 @@
+"""Replicate merging"""
+import numpy as np
+
+from pokemon_evolution.experiments import run_replicates
+
+def test_replicates_with_early_stopping():
+    config = {"STOP_WINDOW": 6, "STOP_CV": 0.5, "STOP_TREND": 0.5, "K_TOTAL": 800, "P_TOTAL": 8000.0}
+    data = run_replicates(4, generations=30, processes=2, config=config)
+    stopped = data['stopped']
+    assert list(stopped['replicate']) == [0, 1, 2, 3]
+    assert (stopped['generation'] < 30).all() and (stopped['reason'] != "").all()
+    assert data['species_counts'].shape[:2] == (4, 30)
+    for r, last in zip(stopped['replicate'], stopped['generation']):
+        assert not np.isnan(data['species_counts'][r, :last]).any()
+        assert np.isnan(data['species_counts'][r, last:]).all()
+        assert data['gen_logs'].query("replicate == @r")['gen'].max() == last - 1
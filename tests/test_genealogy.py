@@ -0,0 +1,17 @@
+"""Genealogy queries on empty and simulated stores"""
+import numpy as np
+
+import pokemon_evolution as pe
+from pokemon_evolution.genealogy import rows_of, descendants, lineage_survival
+
+def test_empty_store():
+    empty = pe.Genealogy()
+    np.testing.assert_array_equal(rows_of(empty, [1, 2]), [-1, -1])
+    assert len(descendants(empty, [1])) == 0
+    assert len(lineage_survival(empty, [1])) == 0
+
+def test_lineage_counts_exclude_founders():
+    results = pe.run_simulation({"GENEALOGY": True, "K_TOTAL": 800, "P_TOTAL": 8000.0}, generations=10, seed=2)
+    pop = results['population']
+    table = lineage_survival(results['genealogy'], pop.uid[pop.alive])
+    assert (table['living_descendants'] <= table['descendants_born']).all()
@@ -0,0 +1,9 @@
+"""Habitat-grid runs"""
+import pokemon_evolution as pe
+
+def test_grid_run_to_extinction():
+    # Generations with no ready breeders must not break cell-wise mate pairing
+    for layout in ["standard", "compact"]:
+        config = {"FOOD_COST": 30, "GRID_SIZE": 3, "K_TOTAL": 800, "P_TOTAL": 8000.0, "POPULATION_LAYOUT": layout}
+        results = pe.run_simulation(config, generations=12, seed=1)
+        assert results['gen_logs'][-1]['total_pop'] == 0